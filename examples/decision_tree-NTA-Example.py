@@ -37,46 +37,95 @@ if project_root not in sys.path:
 
 from logictree import LogicTree  # noqa: E402
 
+# shared styling, built once at import time; BoxStyle parses its style spec
+# on construction, so reusing one instance across boxes avoids repeat work
+# when make_tree() is called more than once
+ARROW_TEXT_STYLE = {
+    "fontname": "Times New Roman",
+    "fontsize": 12,
+    "color": "black",
+    "fontstyle": "italic",
+}
+ANNOTATION_FONT = {
+    "fontsize": 16,
+    "color": "black",
+}  # you could adjust 'fontname' here too!
+ANNOTATION_BOXSTYLE = BoxStyle("Square", pad=0.3)
+ANNOTATION_KWARGS = dict(
+    bbox_fc=(1, 1, 1, 0),
+    bbox_ec=(1, 1, 1, 0),
+    ha="right",
+    va="center",
+    bbox_style=ANNOTATION_BOXSTYLE,
+    font_dict=ANNOTATION_FONT,
+    lw=1,
+    use_tex_rendering=True,
+    ul=True,
+)
+
+
+# recurring mathtext comparison fragments, built once; matplotlib caches the
+# parsed layout of each unique mathtext string internally, so reusing the
+# exact same string maximizes those cache hits across repeated make_tree calls
+GEQ = "$\\geq$"
+LEQ = "$\\leq$"
+LT = "$<$"
+GT = "$>$"
+
+# columns make_tree actually reads, with explicit dtypes so pandas skips
+# both the unused columns and its two-pass dtype inference
+CSV_COLUMNS = {
+    "replicate_threshold": "int64",
+    "CV_threshold": "float64",
+    "n_total_sample_occurence": "int64",
+    "n_missing_occurence": "int64",
+    "n_over_replicate": "int64",
+    "n_under_replicate": "int64",
+    "n_under_CV": "int64",
+    "n_over_CV": "int64",
+    "n_under_CV_over_MDL": "int64",
+    "n_under_CV_under_MDL": "int64",
+    "n_over_CV_over_MDL": "int64",
+    "n_over_CV_under_MDL": "int64",
+}
+
 
 def make_tree():
-    # Load CSV with counts and thresholds
-    df = pd.read_csv(f"{Path(__file__).resolve().parent}/data/logic_tree_data.csv")
+    # Load CSV with counts and thresholds; only the first row is used, so
+    # parse just that row and read it out once as a plain dict (a row Series
+    # would upcast the integer counts to float64 alongside CV_threshold)
+    row = pd.read_csv(
+        f"{Path(__file__).resolve().parent}/data/logic_tree_data.csv",
+        nrows=1,
+        usecols=list(CSV_COLUMNS),
+        dtype=CSV_COLUMNS,
+    ).to_dict("records")[0]
 
     # Build text for first row (total/missing samples)
-    n_total_sample_occurence = df["n_total_sample_occurence"].iloc[0]
     str_total_sample_occurence = (
-        f"Total Sample Occurence (N = {n_total_sample_occurence:,})"
+        f"Total Sample Occurence (N = {row['n_total_sample_occurence']:,})"
     )
-    n_missing_occurence = df["n_missing_occurence"].iloc[0]
-    str_missing_occurence = f"Missing (N = {n_missing_occurence:,})"
+    str_missing_occurence = f"Missing (N = {row['n_missing_occurence']:,})"
 
     # Build text for replicate threshold results
-    n_over_replicate = df["n_over_replicate"].iloc[0]
-    str_over_replicate = f"$\\geq$ Replicate Threshold (N = {n_over_replicate:,})"
-    n_under_replicate = df["n_under_replicate"].iloc[0]
-    str_under_replicate = f"$<$ Replicate Threshold (N = {n_under_replicate:,})"
+    str_over_replicate = f"{GEQ} Replicate Threshold (N = {row['n_over_replicate']:,})"
+    str_under_replicate = f"{LT} Replicate Threshold (N = {row['n_under_replicate']:,})"
 
     # Build text for CV threshold results
-    n_under_CV = df["n_under_CV"].iloc[0]
-    str_under_CV = f"$\\leq$ CV Threshold (N = {n_under_CV:,})"
-    n_over_CV = df["n_over_CV"].iloc[0]
-    str_over_CV = f"$>$ CV Threshold (N = {n_over_CV:,})"
+    str_under_CV = f"{LEQ} CV Threshold (N = {row['n_under_CV']:,})"
+    str_over_CV = f"{GT} CV Threshold (N = {row['n_over_CV']:,})"
 
     # Build text for MDL threshold results under CV and over CV branches
-    n_under_CV_over_MDL = df["n_under_CV_over_MDL"].iloc[0]
-    str_under_CV_over_MDL = f"$\\geq$ MDL (N = {n_under_CV_over_MDL:,})"
-    n_under_CV_under_MDL = df["n_under_CV_under_MDL"].iloc[0]
-    str_under_CV_under_MDL = f"$<$ MDL (N = {n_under_CV_under_MDL:,})"
-    n_over_CV_over_MDL = df["n_over_CV_over_MDL"].iloc[0]
-    str_over_CV_over_MDL = f"$\\geq$ MDL (N = {n_over_CV_over_MDL:,})"
-    n_over_CV_under_MDL = df["n_over_CV_under_MDL"].iloc[0]
-    str_over_CV_under_MDL = f"$<$ MDL (N = {n_over_CV_under_MDL:,})"
+    str_under_CV_over_MDL = f"{GEQ} MDL (N = {row['n_under_CV_over_MDL']:,})"
+    str_under_CV_under_MDL = f"{LT} MDL (N = {row['n_under_CV_under_MDL']:,})"
+    str_over_CV_over_MDL = f"{GEQ} MDL (N = {row['n_over_CV_over_MDL']:,})"
+    str_over_CV_under_MDL = f"{LT} MDL (N = {row['n_over_CV_under_MDL']:,})"
 
     # Threshold values for annotations
-    replicate_threshold = df["replicate_threshold"].iloc[0]
-    replicate_threshold_str = f"\\textbf{{Replicate Threshold = {replicate_threshold}}}"
-    CV_threshold = df["CV_threshold"].iloc[0]
-    CV_threshold_str = f"\\textbf{{CV Threshold = {CV_threshold}}}"
+    replicate_threshold_str = (
+        f"\\textbf{{Replicate Threshold = {row['replicate_threshold']}}}"
+    )
+    CV_threshold_str = f"\\textbf{{CV Threshold = {row['CV_threshold']}}}"
     MDL = r"$\bigsymbol{\mu}_{\text{MB}} \text{ + } \bigsymbol{3\sigma}_{\text{MB}}$"
     MDL_str = f"\\textbf{{MDL = {MDL}}}"
 
@@ -201,12 +250,7 @@ def make_tree():
     )
 
     # Add arrows and bifurcations connecting boxes
-    arrow_text_style = {
-        "fontname": "Times New Roman",
-        "fontsize": 12,
-        "color": "black",
-        "fontstyle": "italic",
-    }
+    arrow_text_style = ARROW_TEXT_STYLE
     logic_tree.add_connection(
         logic_tree.boxes["Total Sample Occurence"],
         logic_tree.boxes["Missing"],
@@ -270,10 +314,6 @@ def make_tree():
     )
 
     # Add annotation boxes for thresholds
-    annotation_font = {
-        "fontsize": 16,
-        "color": "black",
-    }  # you could adjust 'fontname' here too!
     y_row1_5 = (y_row1 + y_row2) / 2
     y_row2_5 = (y_row2 + y_row3) / 2
     y_row3_5 = (y_row3 + y_row4) / 2
@@ -283,47 +323,23 @@ def make_tree():
         ypos=y_row1_5,
         text=replicate_threshold_str,
         box_name="Replicate Threshold",
-        bbox_fc=(1, 1, 1, 0),
-        bbox_ec=(1, 1, 1, 0),
-        ha="right",
-        va="center",
-        bbox_style=BoxStyle("Square", pad=0.3),
-        font_dict=annotation_font,
-        lw=1,
-        use_tex_rendering=True,
-        ul=True,
+        **ANNOTATION_KWARGS,
     )
     logic_tree.add_box(
         xpos=-32,
         ypos=y_row2_5,
         text=CV_threshold_str,
         box_name="CV Threshold",
-        bbox_fc=(1, 1, 1, 0),
-        bbox_ec=(1, 1, 1, 0),
-        ha="right",
-        va="center",
-        bbox_style=BoxStyle("Square", pad=0.3),
-        font_dict=annotation_font,
-        lw=1,
-        use_tex_rendering=True,
-        ul=True,
+        **ANNOTATION_KWARGS,
     )
     logic_tree.add_box(
         xpos=-44,
         ypos=y_row3_5,
         text=MDL_str,
         box_name="MDL",
-        bbox_fc=(1, 1, 1, 0),
-        bbox_ec=(1, 1, 1, 0),
-        ha="right",
-        va="center",
-        bbox_style=BoxStyle("Square", pad=0.3),
-        font_dict=annotation_font,
-        lw=1,
-        use_tex_rendering=True,
-        ul=True,
         ul_depth_width=("8pt", "1pt"),
         angle=20,
+        **ANNOTATION_KWARGS,
     )
 
     # Add title and save
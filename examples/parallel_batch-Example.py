@@ -0,0 +1,108 @@
+"""
+Parallel Batch Rendering of LogicTree Diagrams
+
+This example shows how to generate many independent LogicTree figures at once
+using a process pool. Each tree is built and saved entirely inside a worker
+process, so batch workloads (e.g. a web app producing one tree per filter
+setting) scale nearly linearly with core count. Thread pools do not help here
+because matplotlib rendering holds the GIL; separate processes do.
+
+Key Features Demonstrated
+-------------------------
+- Constructing trees headlessly with ``LogicTree(interactive=False)``, which
+  builds directly on an Agg canvas and never opens a GUI window
+- A pure worker function taking all inputs (parameters and output path) so it
+  can be dispatched with ``multiprocessing.Pool.map``
+- ``maxtasksperchild`` to keep long-lived workers from accumulating
+  matplotlib's internal caches
+
+Output
+------
+One PNG per job in `resources/logictree_examples/batch/`.
+"""
+
+from multiprocessing import Pool
+import os
+from pathlib import Path
+import sys
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from logictree import LogicTree  # noqa: E402
+
+
+def render_tree(job: dict) -> str:
+    """Build and save one small pass/fail tree; runs inside a worker process."""
+    tree = LogicTree(
+        xlims=(0, 100),
+        ylims=(0, 100),
+        title=job["title"],
+        interactive=False,
+    )
+    tree.add_box(
+        xpos=50,
+        ypos=75,
+        text=f"Samples (N = {job['n_total']:,})",
+        box_name="total",
+        bbox_fc="white",
+        bbox_ec="black",
+        ha="center",
+    )
+    tree.add_box(
+        xpos=25,
+        ypos=30,
+        text=f"Kept (N = {job['n_kept']:,})",
+        box_name="kept",
+        bbox_fc="white",
+        bbox_ec="black",
+        ha="center",
+    )
+    tree.add_box(
+        xpos=75,
+        ypos=30,
+        text=f"Removed (N = {job['n_total'] - job['n_kept']:,})",
+        box_name="removed",
+        bbox_fc="#f58181",
+        bbox_ec="#a40000",
+        ha="center",
+    )
+    tree.add_connection_biSplit(
+        tree.boxes["total"],
+        tree.boxes["kept"],
+        tree.boxes["removed"],
+        arrow_head=True,
+        shaft_width=12,
+        fill_connection=True,
+    )
+    tree.make_title(pos="left")
+    tree.save_as_png(file_name=job["out_path"], dpi=300)
+    return job["out_path"]
+
+
+def main():
+    out_dir = (
+        Path(__file__).resolve().parent.parent / "resources/logictree_examples/batch"
+    )
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    jobs = [
+        {
+            "title": f"Filter Setting {i}",
+            "n_total": 10000,
+            "n_kept": 10000 - 500 * i,
+            "out_path": str(out_dir / f"tree_filter_{i}.png"),
+        }
+        for i in range(8)
+    ]
+
+    # one process per core; maxtasksperchild recycles workers so matplotlib's
+    # caches cannot grow without bound in long batch runs
+    with Pool(processes=os.cpu_count(), maxtasksperchild=50) as pool:
+        for path in pool.map(render_tree, jobs):
+            print(f"wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
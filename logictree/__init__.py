@@ -13,14 +13,25 @@ __author__ = "E. Tyler Carr"
 __email__ = "carret1268@gmail.com"
 __license__ = "CC0 1.0 Universal"
 
+import logging
+from typing import Any
+
 from .logictree import LogicTree
 from .logicbox import LogicBox
-from .vector_detector import VectorDetector
 from .arrow_etc import ArrowETC
 
 __all__ = ["LogicTree", "LogicBox", "VectorDetector", "ArrowETC"]
 
-import logging
+
+def __getattr__(name: str) -> Any:
+    # VectorDetector pulls in OpenCV, which is heavy and unused by most
+    # LogicTree workflows; defer that import until first attribute access
+    if name == "VectorDetector":
+        from .vector_detector import VectorDetector
+
+        return VectorDetector
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
@@ -34,9 +34,12 @@ Examples
 
 """
 
+import math
 from typing import List, Tuple, Union
 
 from matplotlib.axes import Axes
+from matplotlib.patches import Polygon
+from matplotlib.typing import LineStyleType
 import matplotlib.pyplot as plt
 import numpy as np
 from numpy.typing import NDArray
@@ -44,6 +47,18 @@ from scipy.interpolate import splprep, splev
 
 FloatLike = Union[float, np.float64]
 
+# Memoized arrow geometry keyed by (path, shaft/head parameters, transform
+# fingerprint). Trees routinely rebuild arrows with identical shape parameters
+# (bi-splits alone construct three near-identical arrows per connection), so
+# repeated constructions can skip the vertex pipeline entirely. The cache is
+# cleared wholesale once it grows past _GEOMETRY_CACHE_MAX entries.
+_GEOMETRY_CACHE: dict = {}
+_GEOMETRY_CACHE_MAX = 4096
+
+# angle constants hoisted out of the hot vertex loops
+_HALF_PI = math.pi / 2
+_TWO_PI = 2 * math.pi
+
 
 class ArrowETC:
     """
@@ -82,8 +97,9 @@ class ArrowETC:
         Fill color of the arrow body. Default is "white".
     lw : float, optional
         Line width of the arrow edge. Default is 1.5.
-    ls : str, optional
-        Line style for the arrow outline (e.g., '-', '--'). Default is "-".
+    ls : str or tuple, optional
+        Line style for the arrow outline (e.g., '-', '--', or an offset/dash
+        tuple). Default is "-".
     zorder : float, optional
         Drawing order on the plot. Higher values appear on top. Default is 100.
     bezier : bool, optional
@@ -99,17 +115,17 @@ class ArrowETC:
         The input list of (x, y) coordinates defining the arrow path.
     path_px : list of tuple[float, float]
         The input list of (x, y) coordinates defining the arrow path after being transformed to display (pixel) space.
-    x_path : list of float
-        X-coordinates of the path.
-    y_path : list of float
-        Y-coordinates of the path.
+    x_path : np.ndarray
+        X-coordinates of the path (view into the path array).
+    y_path : np.ndarray
+        Y-coordinates of the path (view into the path array).
     n_path : int
         Number of path points.
     n_segments : int
         Number of segments connecting the path points (n_path - 1).
-    segment_lengths : list of float or None
+    segment_lengths : np.ndarray or None
         Euclidean lengths of each straight segment. None if Bezier is used.
-    path_angles : list of float
+    path_angles : np.ndarray
         Angle (in radians) each straight segment makes with the x-axis. Undefined for Bezier.
     vertices : np.ndarray of shape (N, 2)
         Final arrow polygon vertices in data coordinates.
@@ -119,6 +135,41 @@ class ArrowETC:
         Y-coordinates of polygon vertices.
     """
 
+    # trees build many arrows (three per bi-split connection); slots drop
+    # the per-instance __dict__ and keep attribute access on fixed offsets
+    __slots__ = (
+        "ax",
+        "arrow_head_width_multiplier",
+        "arrow_head_length_multiplier",
+        "ec",
+        "fc",
+        "lw",
+        "ls",
+        "zorder",
+        "bezier",
+        "bezier_n",
+        "close_tail",
+        "shaft_width",
+        "arrow_head",
+        "arrow_head_at_tail",
+        "_head_width",
+        "_head_length",
+        "path",
+        "_pts",
+        "path_px",
+        "n_path",
+        "n_segments",
+        "n_segment_vertices",
+        "n_vertices",
+        "segment_lengths",
+        "path_angles",
+        "reverse_path_angles",
+        "curve_samples",
+        "angles_px",
+        "vertices_px",
+        "vertices",
+    )
+
     def __init__(
         self,
         ax: Axes,
@@ -131,27 +182,21 @@ class ArrowETC:
         ec: str = "grey",
         fc: str = "white",
         lw: FloatLike = 1.5,
-        ls: str = "-",
+        ls: LineStyleType = "-",
         zorder: FloatLike = 100,
         bezier: bool = False,
         bezier_n: int = 400,
         close_tail: bool = True,
     ) -> None:
         # data validation
-        self.n_path = len(path)
-        if self.n_path < 2:
-            raise ValueError(
-                f"The `path` parameter must have at least 2 points, not {self.n_path}"
-            )
         if shaft_width <= 0:
             raise ValueError(
                 f"The `shaft_width` parameter must be greater than 0, not {shaft_width}"
             )
 
-        # set parameters
-        self.path = path
+        # set styling/shape parameters; path-dependent geometry is built by
+        # set_path so an instance can be rebuilt in place for a new path
         self.ax = ax
-        self.path_px = ax.transData.transform(np.array(self.path))
         self.arrow_head_width_multiplier = arrow_head_width_multiplier
         self.arrow_head_length_multiplier = arrow_head_length_multiplier
         self.ec = ec
@@ -161,43 +206,162 @@ class ArrowETC:
         self.zorder = zorder
         self.bezier = bezier
         self.bezier_n = bezier_n
-        self.x_path = [coord[0] for coord in path]
-        self.y_path = [coord[1] for coord in path]
         self.close_tail = close_tail
+        self.shaft_width = shaft_width
+        self.arrow_head = arrow_head
+        self.arrow_head_at_tail = arrow_head_at_tail
+        # head geometry is invariant across rebuilds, so derive it once here
+        self._head_width = float(shaft_width) * arrow_head_width_multiplier
+        self._head_length = float(shaft_width) * arrow_head_length_multiplier
+
+        self.set_path(path)
+
+    def set_path(self, path: List[Tuple[FloatLike, FloatLike]]) -> None:
+        """
+        Rebuild the arrow geometry in place for a new path.
+
+        All styling and arrowhead parameters are kept; only the path-dependent
+        state (segment metadata, angles, and the vertex polygon) is recomputed.
+        This lets a single ArrowETC instance be reused across many paths
+        instead of paying full construction and GC cost per arrow.
+
+        Parameters
+        ----------
+        path : list of tuple[float, float]
+            Sequence of (x, y) points defining the new arrow path.
+
+        Raises
+        ------
+        ValueError
+            If the path has fewer than two points.
+        """
+        self.n_path = len(path)
+        if self.n_path < 2:
+            raise ValueError(
+                f"The `path` parameter must have at least 2 points, not {self.n_path}"
+            )
+
+        self.path = path
+        # keep the path as one (N, 2) float array; the coordinate attributes
+        # below are views into it, so no per-point Python lists are built
+        path_arr = np.asarray(path, dtype=np.float64)
+        self._pts = path_arr
+        self.path_px = self.ax.transData.transform(path_arr)
         self.n_segments = self.n_path - 1  # actual number of line segments
         self.n_segment_vertices = 2 * (
             1 + self.n_segments
         )  # vertex count w/o arrow head
         self.segment_lengths = self._get_segment_length() if not self.bezier else None
 
-        if arrow_head:
+        if self.arrow_head:
             self.n_vertices = self.n_segment_vertices + 3  # vertex count w/ arrow head
         else:
             self.n_vertices = self.n_segment_vertices
 
         # find the angles each segment makes with the (+) horizontal (CCW)
-        self.path_angles = self._get_angles(path=path)
+        self.path_angles = self._get_angles(path=path_arr)
 
         # getting angles in reverse is essential for the way vertices are calculated
-        self.reverse_path_angles = self._get_angles(path=path[::-1])
-        self.shaft_width = shaft_width
-        self.arrow_head = arrow_head
-        self.arrow_head_at_tail = arrow_head_at_tail
-
-        if self.bezier:
-            self.curve_samples = self._get_bezier_samples()
-            verts = self._build_vertices_from_bezier_display_path()
+        # a reversed segment's angle is just the forward angle rotated by pi,
+        # taken in reverse order - no second pass over the path is needed
+        self.reverse_path_angles = (self.path_angles[::-1] + math.pi) % _TWO_PI
+
+        # geometry is translation-equivariant (miters, arrowheads, and spline
+        # fits all shift with the path), so the cache stores everything
+        # relative to the first path point and translated copies share entries.
+        # That only holds for affine transforms; on e.g. log-scaled axes the
+        # display-space shape depends on absolute position, so skip the cache
+        cacheable = self.ax.transData.is_affine
+        cached = _GEOMETRY_CACHE.get(self._geometry_cache_key()) if cacheable else None
+        p0 = path_arr[0]
+        p0_px = self.path_px[0]
+        if cached is not None:
+            if self.bezier:
+                self.curve_samples = cached["curve_samples"] + p0
+            self.angles_px = cached["angles_px"]
+            self.vertices_px = cached["vertices_px"] + p0_px
+            verts = cached["verts"] + p0
         else:
-            verts = self._build_vertices_from_display_path()
-
-        # optionally close the polygon at the butt end
+            if self.bezier:
+                self.curve_samples = self._get_bezier_samples()
+                verts = self._build_vertices_from_bezier_display_path()
+            else:
+                verts = self._build_vertices_from_display_path()
+            verts = np.asarray(verts, dtype=np.float64)
+
+            if cacheable:
+                if len(_GEOMETRY_CACHE) >= _GEOMETRY_CACHE_MAX:
+                    _GEOMETRY_CACHE.clear()
+                _GEOMETRY_CACHE[self._geometry_cache_key()] = {
+                    "curve_samples": (
+                        self.curve_samples - p0 if self.bezier else None
+                    ),
+                    "angles_px": self.angles_px,
+                    "vertices_px": np.asarray(self.vertices_px, dtype=np.float64)
+                    - p0_px,
+                    "verts": verts - p0,
+                }
+
+        # optionally close the polygon at the butt end; fill a preallocated
+        # (N+1, 2) buffer rather than paying vstack's second full copy
         if self.close_tail:
-            self.vertices = np.vstack((verts, verts[0]))
+            n = len(verts)
+            closed = np.empty((n + 1, 2), dtype=np.float64)
+            closed[:n] = verts
+            closed[n] = verts[0]
+            self.vertices = closed
         else:
             self.vertices = np.asarray(verts)
 
-        self.x_vertices = self.vertices[:, 0]
-        self.y_vertices = self.vertices[:, 1]
+    @property
+    def x_path(self) -> np.ndarray:
+        """X-coordinates of the path (view into the shared points array)."""
+        return self._pts[:, 0]
+
+    @property
+    def y_path(self) -> np.ndarray:
+        """Y-coordinates of the path (view into the shared points array)."""
+        return self._pts[:, 1]
+
+    @property
+    def x_vertices(self) -> np.ndarray:
+        """X-coordinates of the polygon vertices (view into `vertices`)."""
+        return self.vertices[:, 0]
+
+    @property
+    def y_vertices(self) -> np.ndarray:
+        """Y-coordinates of the polygon vertices (view into `vertices`)."""
+        return self.vertices[:, 1]
+
+    def _geometry_cache_key(self) -> tuple:
+        """
+        Build a hashable key identifying this arrow's vertex geometry.
+
+        The key covers the segment deltas (not absolute positions - cached
+        geometry is stored relative to the first path point, so translated
+        copies of a shape share one entry), every shaft/arrowhead shape
+        parameter, and the scale of the data-to-display transform. Two arrows
+        with equal keys produce vertex geometry identical up to translation.
+
+        Returns
+        -------
+        tuple
+            Hashable cache key for `_GEOMETRY_CACHE`.
+        """
+        probe = self.ax.transData.transform([(0.0, 0.0), (1.0, 1.0)])
+        deltas = np.round(np.diff(self._pts, axis=0), 9)
+        return (
+            tuple(deltas.ravel().tolist()),
+            float(self.shaft_width),
+            self.arrow_head,
+            self.arrow_head_at_tail,
+            float(self.arrow_head_width_multiplier),
+            float(self.arrow_head_length_multiplier),
+            self.bezier,
+            self.bezier_n,
+            float(probe[1][0] - probe[0][0]),
+            float(probe[1][1] - probe[0][1]),
+        )
 
     def _build_vertices_from_display_path(self) -> np.ndarray:
         """
@@ -228,115 +392,98 @@ class ArrowETC:
                 "ArrowETC must have `self.ax` set to use display-based geometry."
             )
 
-        path = self.path
         trans = self.ax.transData
         inv_trans = trans.inverted()
 
-        # transform path points from data to display space
-        path_disp = np.vstack([trans.transform(p) for p in path])
+        # transform all path points from data to display space in one call,
+        # reusing the points array set_path already built
+        path_disp = trans.transform(self._pts)
         self.path_px = path_disp
         angles_disp = self._get_angles(path_disp)
         self.angles_px = angles_disp
-        angles_disp_rev = self._get_angles(path_disp[::-1])
+        angles_disp_rev = (angles_disp[::-1] + math.pi) % _TWO_PI
 
-        # setup
+        # setup; vertices accumulate as plain (x, y) float tuples and are
+        # stacked into one ndarray at the end - building a tiny np.array per
+        # vertex costs more than the geometry itself at these sizes
         w2 = self.shaft_width / 2
-        vertices_disp = []
+        vertices_disp: list = []
+
+        def miter_vertex(
+            bx: float, by: float, theta_1: float, theta_2: Union[float, None]
+        ) -> Tuple[float, float]:
+            # offset point along the first segment's normal
+            d1x, d1y = math.cos(theta_1), math.sin(theta_1)
+            ax_ = bx - w2 * d1y
+            ay_ = by + w2 * d1x
+            if theta_2 is None:
+                return ax_, ay_
+            d2x, d2y = math.cos(theta_2), math.sin(theta_2)
+            det = d2x * d1y - d1x * d2y
+            if abs(det) < 1e-9:
+                # parallel segments: fall back to the averaged normal
+                nx = (-d1y - d2y) / 2
+                ny = (d1x + d2x) / 2
+                norm = math.hypot(nx, ny)
+                return bx + w2 * nx / norm, by + w2 * ny / norm
+            # intersect the two offset lines (2x2 solve via Cramer's rule)
+            rx = (bx - w2 * d2y) - ax_
+            ry = (by + w2 * d2x) - ay_
+            t = (d2x * ry - d2y * rx) / det
+            return ax_ + t * d1x, ay_ + t * d1y
 
         # forward traversal (left side)
-        for i in range(len(path_disp) - 1):
-            A_disp = path_disp[i]
-            B_disp = path_disp[i + 1]
+        n_disp = len(path_disp)
+        n_ang = len(angles_disp)
+        for i in range(n_disp - 1):
             theta_1 = angles_disp[i]
-            theta_2 = angles_disp[i + 1] if i + 1 < len(angles_disp) else None
+            theta_2 = angles_disp[i + 1] if i + 1 < n_ang else None
 
             if i == 0:
-                dx = np.cos(theta_1 + np.pi / 2)
-                dy = np.sin(theta_1 + np.pi / 2)
-                normal = np.array([dx, dy])
-                normal /= np.linalg.norm(normal)
-                vertex = np.array(A_disp) + w2 * normal
-                vertices_disp.append(vertex)
+                vertices_disp.append(
+                    (
+                        path_disp[0, 0] + w2 * math.cos(theta_1 + _HALF_PI),
+                        path_disp[0, 1] + w2 * math.sin(theta_1 + _HALF_PI),
+                    )
+                )
 
             # miter join vertex at joint B
-            point = np.array(B_disp)
-            d1 = np.array([np.cos(theta_1), np.sin(theta_1)])
-            d2 = (
-                np.array([np.cos(theta_2), np.sin(theta_2)])
-                if theta_2 is not None
-                else None
+            vertices_disp.append(
+                miter_vertex(path_disp[i + 1, 0], path_disp[i + 1, 1], theta_1, theta_2)
             )
-            perp1 = np.array([-d1[1], d1[0]])
-            A = point + w2 * perp1
-
-            if theta_2 is None or d2 is None:
-                vertex = A
-            else:
-                perp2 = np.array([-d2[1], d2[0]])
-                B = point + w2 * perp2
-                mat = np.column_stack((d1, -d2))
-                if np.linalg.matrix_rank(mat) < 2:
-                    avg_normal = (perp1 + perp2) / 2
-                    avg_normal /= np.linalg.norm(avg_normal)
-                    vertex = point + w2 * avg_normal
-                else:
-                    t = np.linalg.solve(mat, B - A)[0]
-                    vertex = A + t * d1
-
-            vertices_disp.append(vertex)
 
         # reverse traversal (right side)
         path_disp_rev = path_disp[::-1]
-        for i in range(len(path_disp_rev) - 1):
-            A_disp = path_disp_rev[i]
-            B_disp = path_disp_rev[i + 1]
+        for i in range(n_disp - 1):
             theta_1 = angles_disp_rev[i]
-            theta_2 = angles_disp_rev[i + 1] if i + 1 < len(angles_disp_rev) else None
+            theta_2 = angles_disp_rev[i + 1] if i + 1 < n_ang else None
 
             if i == 0 and not self.arrow_head:
-                dx = np.cos(theta_1 + np.pi / 2)
-                dy = np.sin(theta_1 + np.pi / 2)
-                normal = np.array([dx, dy])
-                normal /= np.linalg.norm(normal)
-                vertex = np.array(A_disp) + w2 * normal
-                vertices_disp.append(vertex)
-
-            point = np.array(B_disp)
-            d1 = np.array([np.cos(theta_1), np.sin(theta_1)])
-            d2 = (
-                np.array([np.cos(theta_2), np.sin(theta_2)])
-                if theta_2 is not None
-                else None
-            )
-            perp1 = np.array([-d1[1], d1[0]])
-            A = point + w2 * perp1
-
-            if theta_2 is None or d2 is None:
-                vertex = A
-            else:
-                perp2 = np.array([-d2[1], d2[0]])
-                B = point + w2 * perp2
-                mat = np.column_stack((d1, -d2))
-                if np.linalg.matrix_rank(mat) < 2:
-                    avg_normal = (perp1 + perp2) / 2
-                    avg_normal /= np.linalg.norm(avg_normal)
-                    vertex = point + w2 * avg_normal
-                else:
-                    t = np.linalg.solve(mat, B - A)[0]
-                    vertex = A + t * d1
+                vertices_disp.append(
+                    (
+                        path_disp_rev[0, 0] + w2 * math.cos(theta_1 + _HALF_PI),
+                        path_disp_rev[0, 1] + w2 * math.sin(theta_1 + _HALF_PI),
+                    )
+                )
 
-            vertices_disp.append(vertex)
+            vertices_disp.append(
+                miter_vertex(
+                    path_disp_rev[i + 1, 0],
+                    path_disp_rev[i + 1, 1],
+                    theta_1,
+                    theta_2,
+                )
+            )
 
         if self.arrow_head or self.arrow_head_at_tail:
             vertices_disp = self._add_arrow_head_vertices_px(
                 vertices_px=vertices_disp,
             )
 
-        # transform all display-space vertices back to data-space
-        self.vertices_px = vertices_disp
-        vertices_data = np.array(
-            [inv_trans.transform(p) for p in vertices_disp], dtype=np.float64
-        )
+        # transform all display-space vertices back to data-space in one call
+        vertices_px = np.asarray(vertices_disp, dtype=np.float64)
+        self.vertices_px = vertices_px
+        vertices_data = inv_trans.transform(vertices_px)
 
         return vertices_data
 
@@ -371,32 +518,28 @@ class ArrowETC:
             return vertices_px
 
         def build_arrow_head(tip: np.ndarray, theta: FloatLike) -> List[np.ndarray]:
-            # unit direction and perpendicular vectors
-            dir_vec = np.array([np.cos(theta), np.sin(theta)])
-            perp_vec = np.array([-dir_vec[1], dir_vec[0]])
-
-            # base center point
-            base_center = tip - head_length * dir_vec
-
-            # base left and right points (wide)
-            base_left = base_center + (head_width / 2) * perp_vec
-            base_right = base_center - (head_width / 2) * perp_vec
+            # one canonical fan template oriented by theta; scalar arithmetic
+            # for the intermediate points, arrays only for the five vertices
+            tx, ty = float(tip[0]), float(tip[1])
+            dx, dy = math.cos(theta), math.sin(theta)
+            px, py = -dy, dx
 
-            # shaft left and right points (narrow)
-            shaft_left = base_center + (shaft_width / 2) * perp_vec
-            shaft_right = base_center - (shaft_width / 2) * perp_vec
+            # base center point, then wide (head) and narrow (shaft) offsets
+            bcx, bcy = tx - head_length * dx, ty - head_length * dy
+            hw2 = head_width / 2
+            sw2 = shaft_width / 2
 
             return [
-                np.array(shaft_left),
-                np.array(base_left),
-                np.array(tip),
-                np.array(base_right),
-                np.array(shaft_right),
+                np.array((bcx + sw2 * px, bcy + sw2 * py)),
+                np.array((bcx + hw2 * px, bcy + hw2 * py)),
+                np.array((tx, ty)),
+                np.array((bcx - hw2 * px, bcy - hw2 * py)),
+                np.array((bcx - sw2 * px, bcy - sw2 * py)),
             ]
 
         shaft_width = self.shaft_width
-        head_width = shaft_width * self.arrow_head_width_multiplier
-        head_length = shaft_width * self.arrow_head_length_multiplier
+        head_width = self._head_width
+        head_length = self._head_length
 
         # split our points where the arrow head ought to go
         left = vertices_px[: len(vertices_px) // 2]
@@ -404,7 +547,7 @@ class ArrowETC:
 
         # if head at tail
         if self.arrow_head_at_tail:
-            theta = self.angles_px[0] + np.pi
+            theta = self.angles_px[0] + math.pi
             tip = self.path_px[0]
             tail_head_verts = build_arrow_head(tip, theta)
 
@@ -515,36 +658,38 @@ class ArrowETC:
         # compute angles along the curve
         angles_disp = self._get_angles(path_disp)
         self.angles_px = angles_disp
-        angles_disp_rev = self._get_angles(path_disp[::-1])
+        angles_disp_rev = (angles_disp[::-1] + math.pi) % _TWO_PI
 
         w2 = self.shaft_width / 2
         left_side = []
         right_side = []
+        n_disp = len(path_disp)
+        n_ang = len(angles_disp)
 
         # build left-side vertices (butt → tip)
-        for i in range(len(path_disp) - 1):
+        for i in range(n_disp - 1):
             A = path_disp[i]
             B = path_disp[i + 1]
             theta1 = angles_disp[i]
-            theta2 = angles_disp[i + 1] if i + 1 < len(angles_disp) else None
+            theta2 = angles_disp[i + 1] if i + 1 < n_ang else None
 
             # butt cap at the very first segment
             if i == 0:
                 normal = np.array(
-                    [np.cos(theta1 + np.pi / 2), np.sin(theta1 + np.pi / 2)]
+                    [math.cos(theta1 + _HALF_PI), math.sin(theta1 + _HALF_PI)]
                 )
                 normal /= np.linalg.norm(normal)
                 left_side.append(np.array(A) + w2 * normal)
 
             # miter-join at B
-            dir1 = np.array([np.cos(theta1), np.sin(theta1)])
+            dir1 = np.array([math.cos(theta1), math.sin(theta1)])
             perp1 = np.array([-dir1[1], dir1[0]])
             A_pt = np.array(B) + w2 * perp1
 
             if theta2 is None:
                 vertex = A_pt
             else:
-                dir2 = np.array([np.cos(theta2), np.sin(theta2)])
+                dir2 = np.array([math.cos(theta2), math.sin(theta2)])
                 perp2 = np.array([-dir2[1], dir2[0]])
                 B_pt = np.array(B) + w2 * perp2
                 mat = np.column_stack((dir1, -dir2))
@@ -560,29 +705,29 @@ class ArrowETC:
 
         # build right-side vertices (tip → butt)
         rev = path_disp[::-1]
-        for i in range(len(rev) - 1):
+        for i in range(n_disp - 1):
             A = rev[i]
             B = rev[i + 1]
             theta1 = angles_disp_rev[i]
-            theta2 = angles_disp_rev[i + 1] if i + 1 < len(angles_disp_rev) else None
+            theta2 = angles_disp_rev[i + 1] if i + 1 < n_ang else None
 
             # butt cap on tail end if no arrowhead
             if i == 0 and not self.arrow_head:
                 normal = np.array(
-                    [np.cos(theta1 + np.pi / 2), np.sin(theta1 + np.pi / 2)]
+                    [math.cos(theta1 + _HALF_PI), math.sin(theta1 + _HALF_PI)]
                 )
                 normal /= np.linalg.norm(normal)
                 right_side.append(np.array(A) + w2 * normal)
 
             # miter-join at B
-            dir1 = np.array([np.cos(theta1), np.sin(theta1)])
+            dir1 = np.array([math.cos(theta1), math.sin(theta1)])
             perp1 = np.array([-dir1[1], dir1[0]])
             A_pt = np.array(B) + w2 * perp1
 
             if theta2 is None:
                 vertex = A_pt
             else:
-                dir2 = np.array([np.cos(theta2), np.sin(theta2)])
+                dir2 = np.array([math.cos(theta2), math.sin(theta2)])
                 perp2 = np.array([-dir2[1], dir2[0]])
                 B_pt = np.array(B) + w2 * perp2
                 mat = np.column_stack((dir1, -dir2))
@@ -618,7 +763,7 @@ class ArrowETC:
             NDArray[np.float64],
             List[np.ndarray],
         ],
-    ) -> List[FloatLike]:
+    ) -> NDArray[np.float64]:
         """
         Compute the angle (in radians) that each segment in the path makes with the positive x-axis.
 
@@ -633,47 +778,31 @@ class ArrowETC:
 
         Returns
         -------
-        list of float
-            List of angles (in radians) between each consecutive pair of points.
+        np.ndarray of shape (N - 1,)
+            Angles (in radians) between each consecutive pair of points.
         """
-        angles: List[FloatLike] = []
-        # if it's an ndarray we can vectorize, otherwise fall back to the loop
-        if isinstance(path, np.ndarray):
-            dx = np.diff(path[:, 0])
-            dy = np.diff(path[:, 1])
-            thetas = np.mod(np.arctan2(dy, dx), 2 * np.pi)
-            return thetas.tolist()
-        else:
-            # covers both List[tuple] and List[np.ndarray]
-            for i in range(len(path) - 1):
-                p1, p2 = path[i], path[i + 1]
-                dx = np.array(p2[0] - p1[0])
-                dy = np.array(p2[1] - p1[1])
-                angles.append(float(np.arctan2(dy, dx) % (2 * np.pi)))
-
-            return angles
-
-    def _get_segment_length(self) -> List[FloatLike]:
+        # stack the points once (a no-copy passthrough for ndarray input) so
+        # every segment angle comes from a single vectorized arctan2 instead
+        # of one Python-level ufunc dispatch per segment
+        pts = np.asarray(path, dtype=np.float64)
+        dx = np.diff(pts[:, 0])
+        dy = np.diff(pts[:, 1])
+        return np.mod(np.arctan2(dy, dx), _TWO_PI)
+
+    def _get_segment_length(self) -> NDArray[np.float64]:
         """
         Compute the Euclidean distance between each consecutive pair of path points.
 
         This method is used only for straight-arrow paths (`bezier=False`).
-        The result is a list of segment lengths in data units.
+        The result is an array of segment lengths in data units.
 
         Returns
         -------
-        list of float
+        np.ndarray of shape (n_segments,)
             Distances between adjacent path points, one for each segment in the arrow.
         """
-        distances = []
-        for i in range(self.n_segments):
-            p1, p2 = self.path[i], self.path[i + 1]
-            x1, y1 = p1[0], p1[1]
-            x2, y2 = p2[0], p2[1]
-            d = np.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
-            distances.append(d)
-
-        return distances
+        # one vectorized pass over the shared points array
+        return np.hypot(np.diff(self._pts[:, 0]), np.diff(self._pts[:, 1]))
 
     def draw_to_ax(self, ax: Axes, fill_arrow: bool = True) -> Axes:
         """
@@ -696,16 +825,26 @@ class ArrowETC:
         matplotlib.axes.Axes
             The same Axes object with the arrow drawn onto it.
         """
-        # fill the shape (face only)
+        # fill the shape (face only). The vertex array is already explicitly
+        # closed when close_tail is set, so build an open-path Polygon
+        # directly - closed=True would copy the array to append a duplicate
+        # closing vertex, and the renderer closes fill contours regardless.
         if fill_arrow:
-            ax.fill(
-                self.x_vertices,
-                self.y_vertices,
-                color=self.fc,
-                zorder=self.zorder,
-                ec="none",
+            ax.add_patch(
+                Polygon(
+                    self.vertices,
+                    closed=False,
+                    facecolor=self.fc,
+                    edgecolor="none",
+                    zorder=self.zorder,
+                )
             )
 
+            # a sub-visible stroke on a filled arrow still costs a full Line2D
+            # artist per render pass; skip it, the fill already covers the shape
+            if self.lw <= 0.05:
+                return ax
+
         # draw the outline (stroke/edge only)
         ax.plot(
             self.x_vertices,
@@ -4,11 +4,46 @@ in logic tree diagrams. Each LogicBox supports custom text, styling, and
 positioning options using matplotlib's BoxStyle.
 """
 
+from functools import lru_cache
 from typing import Any, Dict, Literal, Optional
 
 from matplotlib.patches import BoxStyle
 
 
+@lru_cache(maxsize=128)
+def _bbox_style_dict(
+    boxstyle: BoxStyle, facecolor: Any, edgecolor: Any, linewidth: float
+) -> Dict[str, Any]:
+    """
+    Build (and memoize) the bbox styling dict for one style combination.
+
+    Trees typically reuse a handful of styles across many boxes, so the
+    shared dict is built once per distinct combination. Sharing is safe
+    because matplotlib copies the dict in ``Text.set_bbox`` and LogicBox
+    treats ``style`` as read-only.
+
+    Parameters
+    ----------
+    boxstyle : BoxStyle
+        Matplotlib BoxStyle object specifying box shape and padding.
+    facecolor, edgecolor : color
+        Face and edge colors of the box.
+    linewidth : float
+        Line width of the box's edge.
+
+    Returns
+    -------
+    dict
+        Dictionary containing styling properties for use with matplotlib text boxes.
+    """
+    return {
+        "boxstyle": boxstyle,
+        "facecolor": facecolor,
+        "edgecolor": edgecolor,
+        "linewidth": linewidth,
+    }
+
+
 class LogicBox:
     """
     A box object for use in logic tree diagrams, containing text and visual styling.
@@ -82,6 +117,32 @@ class LogicBox:
         Coordinates of the box center, set during layout.
     """
 
+    # boxes are plentiful in a dense tree; slots drop the per-instance
+    # __dict__ and keep attribute access on fixed offsets
+    __slots__ = (
+        "x",
+        "y",
+        "text",
+        "name",
+        "face_color",
+        "edge_color",
+        "style",
+        "font_dict",
+        "va",
+        "ha",
+        "lw",
+        "angle",
+        "xLeft",
+        "xRight",
+        "yBottom",
+        "yTop",
+        "width",
+        "height",
+        "xCenter",
+        "yCenter",
+        "_layout_ready",
+    )
+
     def __init__(
         self,
         xpos: float,
@@ -103,10 +164,18 @@ class LogicBox:
         if ha not in ("left", "center", "right"):
             raise ValueError(f"Invalid ha: {ha}. Must be 'left', 'center', or 'right'.")
 
-        # create a bbox style object for styling text box
-        my_style = self._my_bbox_style(
-            facecolor=bbox_fc, edgecolor=bbox_ec, linewidth=lw, boxstyle=bbox_style
-        )
+        # create a bbox style dict for styling the text box; identical style
+        # combinations share one memoized dict (unhashable colors, e.g.
+        # lists, fall back to building a fresh dict)
+        try:
+            my_style = _bbox_style_dict(bbox_style, bbox_fc, bbox_ec, lw)
+        except TypeError:
+            my_style = {
+                "boxstyle": bbox_style,
+                "facecolor": bbox_fc,
+                "edgecolor": bbox_ec,
+                "linewidth": lw,
+            }
 
         self.x = xpos
         self.y = ypos
@@ -128,37 +197,10 @@ class LogicBox:
         self.height: Optional[float] = None
         self.xCenter: Optional[float] = None
         self.yCenter: Optional[float] = None
-
-    def _my_bbox_style(
-        self, facecolor: str, edgecolor: str, linewidth: float, boxstyle: BoxStyle
-    ) -> Dict[str, Any]:
-        """
-        Create a dictionary of styling parameters for the box's visual appearance.
-
-        Parameters
-        ----------
-        facecolor : str
-            Face color of the box.
-        edgecolor : str
-            Edge color of the box.
-        linewidth : float or int
-            Line width of the box's edge.
-        boxstyle : BoxStyle
-            Matplotlib BoxStyle object specifying box shape and padding.
-
-        Returns
-        -------
-        dict
-            Dictionary containing styling properties for use with matplotlib text boxes.
-        """
-        my_style = {
-            "boxstyle": boxstyle,
-            "facecolor": facecolor,
-            "edgecolor": edgecolor,
-            "linewidth": linewidth,
-        }
-
-        return my_style
+        # flipped to True by LogicTree.add_box once the edge/center
+        # coordinates above are populated; lets connection code validate
+        # layout with one boolean instead of a string of None checks
+        self._layout_ready = False
 
     def __repr__(self) -> str:
         """
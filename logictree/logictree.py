@@ -12,7 +12,7 @@ Features
 - Add boxes with custom text, alignment, rotation, and visual styling.
 - Connect boxes using straight, segmented, or curved arrows with optional arrowheads.
 - Full support for LaTeX rendering inside boxes and titles.
-- Export to PNG with tight layout control and adjustable aspect ratio.
+- Export to PNG or SVG with tight layout control and adjustable aspect ratio.
 
 Examples
 --------
@@ -49,16 +49,284 @@ Notes
       texlive-latex-extra texlive-humanities dvipng cm-super
 """
 
-from typing import Any, Dict, List, Literal, Optional, Tuple, Union, cast
-
-from math import atan2, degrees
-from matplotlib.patches import BoxStyle
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union, cast
+
+from functools import lru_cache
+from math import hypot
+import re
+from matplotlib.artist import Artist
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.patches import BoxStyle, PathPatch, Polygon
+from matplotlib.path import Path as MplPath
+from matplotlib.typing import LineStyleType
+from matplotlib import font_manager as fm
 import matplotlib.pyplot as plt
-from numpy import hypot
+import numpy as np
 
 from .arrow_etc import ArrowETC
 from .logicbox import LogicBox
 
+def _resolve_colors(
+    box: LogicBox, fc: Optional[str], ec: Optional[str], fill: bool
+) -> Tuple[Optional[str], str]:
+    """
+    Resolve face and edge color settings against a box's default colors.
+
+    The shorthands "fc" and "ec" swap in the box's face or edge color, and
+    None inherits the matching color. The face color is left untouched when
+    the connection is not filled.
+
+    Parameters
+    ----------
+    box : LogicBox
+        The box providing default and fallback colors.
+    fc : str, optional
+        Face color. Can be None, "fc", "ec", or a valid color string.
+    ec : str, optional
+        Edge color. Can be None, "fc", "ec", or a valid color string.
+    fill : bool
+        Whether the connection will be filled.
+
+    Returns
+    -------
+    tuple of (str or None, str)
+        The resolved face color and edge color.
+    """
+    if fill:
+        if fc is None or fc == "fc":
+            fc = box.face_color
+        elif fc == "ec":
+            fc = box.edge_color
+    if ec is None or ec == "ec":
+        ec = box.edge_color
+    elif ec == "fc":
+        ec = box.face_color
+
+    return fc, ec
+
+
+# outward offset direction (x sign, y sign) for each box side; drives the
+# butt/tip offset application in the connection methods instead of a
+# per-call match ladder
+_SIDE_OFFSET_SIGNS: Dict[str, Tuple[int, int]] = {
+    "left": (-1, 0),
+    "right": (1, 0),
+    "top": (0, 1),
+    "bottom": (0, -1),
+    "topLeft": (-1, 1),
+    "topRight": (1, 1),
+    "bottomLeft": (-1, -1),
+    "bottomRight": (1, -1),
+    "center": (0, 0),
+}
+
+def _auto_sides(dx: float, dy: float) -> Tuple[str, str]:
+    """
+    Pick the box sides a connection should attach to, given its direction.
+
+    The sides depend only on which octant the (dx, dy) direction falls in,
+    so plain magnitude comparisons replace the former atan2/degrees round
+    trip; the branch boundaries (ties at the +-45 and 135 degree diagonals)
+    match the old angle-based rules exactly.
+
+    Parameters
+    ----------
+    dx, dy : float
+        Direction of the connection, measured from boxA toward boxB.
+
+    Returns
+    -------
+    tuple of str
+        `(sideA, sideB)` attachment sides, each one of 'left', 'right',
+        'top', 'bottom'.
+    """
+    adx, ady = abs(dx), abs(dy)
+    if dx >= ady:  # theta in [-45, 45]
+        return "right", "left"
+    if dy > adx or (dy == adx and dx < 0):  # theta in (45, 135]
+        return "top", "bottom"
+    if -dx > ady:  # theta beyond +-135
+        return "left", "right"
+    return "bottom", "top"
+
+
+# side name -> (x anchor attribute, y anchor attribute, x sign, y sign);
+# one hash lookup replaces a nine-arm string match in _get_side_coords
+_SIDE_ANCHORS: Dict[str, Tuple[str, str, int, int]] = {
+    "left": ("xLeft", "yCenter", -1, 0),
+    "right": ("xRight", "yCenter", 1, 0),
+    "top": ("xCenter", "yTop", 0, 1),
+    "bottom": ("xCenter", "yBottom", 0, -1),
+    "center": ("xCenter", "yCenter", 0, 0),
+    "topLeft": ("xLeft", "yTop", -1, 1),
+    "topRight": ("xRight", "yTop", 1, 1),
+    "bottomLeft": ("xLeft", "yBottom", -1, -1),
+    "bottomRight": ("xRight", "yBottom", 1, -1),
+}
+
+
+@lru_cache(maxsize=64)
+def _boxstyle(name: str, pad: float) -> BoxStyle:
+    """
+    Return a shared BoxStyle instance for the given style name and padding.
+
+    Boxes with identical styling reuse one BoxStyle object instead of each
+    carrying its own, which cuts object count on large trees and lets
+    matplotlib's internal caches see repeat hits.
+
+    Parameters
+    ----------
+    name : str
+        BoxStyle style name, e.g. "Round".
+    pad : float
+        Padding of the box style, in fractions of the font size.
+
+    Returns
+    -------
+    BoxStyle
+        The shared BoxStyle instance.
+    """
+    return BoxStyle(name, pad=pad)
+
+
+def _bi_branch_paths(
+    Ax2: float,
+    Ay2: float,
+    left_xc: float,
+    left_yc: float,
+    left_yt: float,
+    left_yb: float,
+    right_xc: float,
+    right_yc: float,
+    right_yt: float,
+    right_yb: float,
+    tip_offset: float,
+) -> Tuple[Tuple[Tuple[float, float], ...], Tuple[Tuple[float, float], ...]]:
+    """
+    Compute both bi-split branch paths as nested tuples of (x, y) points.
+
+    Pure scalar kernel for `_get_pathsForBi_left_then_right`: it takes only
+    unpacked box geometry, so it carries no object access in the hot path,
+    and at two branches of three points each, plain scalar ternaries beat
+    the allocation cost of any ndarray formulation.
+
+    Parameters
+    ----------
+    Ax2, Ay2 : float
+        Point where the vertical stem ends and the bifurcation begins.
+    left_xc, left_yc, left_yt, left_yb : float
+        Center x/y, top y, and bottom y of the left target box.
+    right_xc, right_yc, right_yt, right_yb : float
+        Center x/y, top y, and bottom y of the right target box.
+    tip_offset : float
+        Vertical offset applied to each branch tip.
+
+    Returns
+    -------
+    tuple of tuple of (float, float)
+        The left (index 0) and right (index 1) three-point elbow paths.
+    """
+    left_y3 = left_yt + tip_offset if Ay2 > left_yc else left_yb - tip_offset
+    right_y3 = right_yt + tip_offset if Ay2 > right_yc else right_yb - tip_offset
+
+    return (
+        ((Ax2, Ay2), (left_xc, Ay2), (left_xc, left_y3)),
+        ((Ax2, Ay2), (right_xc, Ay2), (right_xc, right_y3)),
+    )
+
+
+# LaTeX preamble for importing latex packages and making a command
+# \bigsymbol{} for enlarging latex math symbols. Module-level so the string
+# is assembled once, not on every add_box call.
+_LATEX_PREAMBLE = (
+    r"\usepackage{bm}"
+    r"\usepackage{amsmath}"
+    r"\usepackage{soul}"
+    r"\setul{2pt}{1pt}"
+    r"\usepackage{relsize}"
+    r"\newcommand{\bigsymbol}[1]{\mathlarger{\mathlarger{\mathlarger{#1}}}}"
+)
+
+# constructs that matplotlib's built-in mathtext engine cannot render; any
+# string containing one of these must go through the full usetex path
+_MATHTEXT_INCOMPATIBLE = re.compile(
+    r"\\(?:ul|setul|bigsymbol|underline|usepackage|begin)\b"
+)
+
+# LaTeX text-mode commands with direct mathtext equivalents; spaces inside
+# the argument are escaped since mathtext collapses them in math mode
+_TEX_TO_MATHTEXT = (
+    (re.compile(r"\\textbf\{([^{}]*)\}"), r"\mathbf"),
+    (re.compile(r"\\textit\{([^{}]*)\}"), r"\mathit"),
+    (re.compile(r"\\text\{([^{}]*)\}"), r"\mathrm"),
+)
+
+# used by _mathtext_compatible to find commands the rewrite left behind in
+# text mode, where mathtext would render them as literal backslash text
+_MATH_SPAN = re.compile(r"\$[^$]*\$")
+_TEX_COMMAND = re.compile(r"\\[A-Za-z]+")
+
+
+@lru_cache(maxsize=1)
+def _installed_font_families() -> frozenset:
+    """Lowercased names of the font families matplotlib knows about.
+
+    Built once from the font manager's in-memory list (no filesystem walk)
+    and cached for the life of the process.
+    """
+    return frozenset(f.name.lower() for f in fm.fontManager.ttflist)
+
+
+def _font_available(family: str) -> bool:
+    """Return True if `family` resolves to an installed font, O(1) per call."""
+    return family.lower() in _installed_font_families()
+
+
+# make_title alignment dispatch: pos doubles as the text ha, and the x
+# coordinate comes from the (left, right) extent pair picked by consider_box_x
+_TITLE_POS_X: Dict[str, Callable[[float, float], float]] = {
+    "left": lambda lo, hi: lo,
+    "center": lambda lo, hi: (lo + hi) / 2,
+    "right": lambda lo, hi: hi,
+}
+
+
+def _mathtext_compatible(text: str) -> bool:
+    """Whether the builtin mathtext engine can render `text` faithfully."""
+    if _MATHTEXT_INCOMPATIBLE.search(text) is not None:
+        return False
+    # the rewrite wraps each command's argument in $...$ without tracking
+    # math-mode boundaries, so a text-mode command mixed with inline math
+    # (e.g. \textbf{MDL = $x$}) would produce unbalanced markup; route any
+    # such string through usetex instead
+    if "$" in text and any(pattern.search(text) for pattern, _ in _TEX_TO_MATHTEXT):
+        return False
+    # conservative screen rather than a blacklist: any command the rewrite
+    # leaves outside $...$ (\emph, \textsc, nested-brace arguments, ...) is
+    # usetex-only and would come out as literal backslash text
+    if _TEX_COMMAND.search(_MATH_SPAN.sub("", _rewrite_for_mathtext(text))):
+        return False
+    return True
+
+
+@lru_cache(maxsize=256)
+def _rewrite_for_mathtext(text: str) -> str:
+    """Rewrite LaTeX text-mode commands into mathtext-renderable markup.
+
+    Memoized so the compatibility screen and the add_box call site share
+    one rewrite per distinct label.
+    """
+    for pattern, cmd in _TEX_TO_MATHTEXT:
+
+        def _sub(match: "re.Match[str]", cmd: str = cmd) -> str:
+            return "$" + cmd + "{" + match.group(1).replace(" ", r"\ ") + "}$"
+
+        text = pattern.sub(_sub, text)
+    return text
+
 
 class LogicTree:
     """
@@ -95,6 +363,17 @@ class LogicTree:
         Override for all box text color (applies to `font_dict` if provided).
     title_color : str, optional
         Override for the title color (applies to `font_dict_title` if provided).
+    defer_render : bool, optional
+        If True, arrows added to the tree are not drawn as individual artists;
+        their geometry is accumulated and drawn as a single LineCollection /
+        PolyCollection pair when `render()` is called (done automatically by
+        `save_as_png`). Greatly reduces artist overhead on large trees.
+        Default is False.
+    interactive : bool, optional
+        If False, the figure is built directly on an Agg canvas instead of
+        through pyplot, skipping GUI backend bookkeeping. Use for
+        build-then-save batch workflows where `plt.show()` is never called.
+        Default is True.
 
     Attributes
     ----------
@@ -131,6 +410,8 @@ class LogicTree:
         font_dict_title: Optional[Dict[str, Any]] = None,
         text_color: Optional[str] = None,
         title_color: Optional[str] = None,
+        defer_render: bool = False,
+        interactive: bool = True,
     ) -> None:
         self.boxes: Dict[str, LogicBox] = {}
         self.arrows: List[ArrowETC] = []
@@ -164,9 +445,13 @@ class LogicTree:
         self.latex_ul_depth = "1pt"
         self.latex_ul_width = "1pt"
 
-        # set style presets
+        # set style presets; fall back to the generic serif family when Times
+        # New Roman is not installed, so unlabeled text draws don't each incur
+        # a findfont miss (and its warning) on systems without the font
         font_defaults = {
-            "font.family": "Times New Roman",
+            "font.family": (
+                "Times New Roman" if _font_available("Times New Roman") else "serif"
+            ),
             "font.size": 14,
             "axes.titlesize": 16,
             "axes.titleweight": "bold",
@@ -184,7 +469,14 @@ class LogicTree:
         plt.rcParams.update(font_defaults)
 
         # generate figure and axes
-        fig, ax = plt.subplots(figsize=fig_size, frameon=True)
+        if interactive:
+            fig, ax = plt.subplots(figsize=fig_size, frameon=True)
+        else:
+            # headless batch path: build the figure on an Agg canvas directly,
+            # skipping pyplot's figure manager and GUI backend hooks entirely
+            fig = Figure(figsize=fig_size, frameon=True)
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot()
         ax.set_xlim(xlims[0], xlims[1])
         ax.set_ylim(ylims[0], ylims[1])
         ax.axis("off")
@@ -198,8 +490,54 @@ class LogicTree:
         self.fig = fig
         self.ax = ax
 
+        # cache the renderer handle and inverted data transform once; bbox
+        # measurement in add_box is the hot path, and both are invariant as
+        # long as the figure geometry is unchanged. A resize invalidates the
+        # cached inverse transform, so refresh it on resize events.
+        self._renderer = fig.canvas.get_renderer()  # type: ignore[attr-defined]
+        self._inv_transData = ax.transData.inverted()
+        fig.canvas.mpl_connect("resize_event", self._on_resize)
+
+        # state for blitting-based batch rendering (see begin_batch/finish_batch)
+        self._batching = False
+        self._pending_artists: List[Artist] = []
+        self._background: Optional[Any] = None
+
+        # state for deferred collection rendering (see render()). When
+        # defer_render is True, arrow geometry is accumulated here and drawn
+        # as two collections instead of ~2 artists per arrow.
+        self._defer_render = defer_render
+
+        # tracks whether rcParams are currently configured for TeX rendering;
+        # None means "not yet set", so the first add_box always applies it
+        self._tex_state: Optional[bool] = None
+
+        # measured box extents keyed by everything that affects them (text,
+        # font, style, alignment). Logic trees repeat labels constantly
+        # ("Yes"/"No" leaves), and a cache hit skips the expensive
+        # draw + get_window_extent round-trip in add_box.
+        self._extent_cache: Dict[tuple, Tuple[float, float, float, float]] = {}
+
+        # running horizontal extents over all boxes, maintained by add_box so
+        # title placement reads them in O(1) instead of rescanning
+        self._xFarLeft = float("inf")
+        self._xFarRight = float("-inf")
+        self._line_segs: List[Any] = []
+        self._line_colors: List[str] = []
+        self._line_widths: List[float] = []
+        self._line_styles: List[LineStyleType] = []
+        self._line_zorders: List[float] = []
+        self._fill_polys: List[Any] = []
+        self._fill_colors: List[str] = []
+        self._fill_zorders: List[float] = []
+
         self._colormode = colormode
 
+    def _on_resize(self, event: Any) -> None:
+        """Refresh cached renderer/transform state after a figure resize."""
+        self._renderer = self.fig.canvas.get_renderer()  # type: ignore[attr-defined]
+        self._inv_transData = self.ax.transData.inverted()
+
     def _get_pathsForBi_left_then_right(
         self,
         Ax2: float,
@@ -239,54 +577,34 @@ class LogicTree:
         ValueError
             If any required coordinates in `left_box` or `right_box` are not initialized.
         """
-        if (
-            left_box.yTop is None
-            or left_box.yBottom is None
-            or left_box.xCenter is None
-            or left_box.yCenter is None
-        ):
+        # add_box always populates the layout coordinates, so one flag read
+        # per box replaces four attribute/None comparisons each
+        if not left_box._layout_ready:
             raise ValueError(
                 "left_box LogicBox layout not initialized before accessing coordinates."
             )
-        if (
-            right_box.yTop is None
-            or right_box.yBottom is None
-            or right_box.xCenter is None
-            or right_box.yCenter is None
-        ):
+        if not right_box._layout_ready:
             raise ValueError(
                 "right_box LogicBox layout not initialized before accessing coordinates."
             )
 
-        # create the leftward arrow
-        Lx1 = Ax2
-        Ly1 = Ay2
-        Lx2 = left_box.xCenter
-        Ly2 = Ly1
-        Lx3 = Lx2
-        Ly3 = (
-            left_box.yTop + tip_offset
-            if Ay2 > left_box.yCenter
-            else left_box.yBottom - tip_offset
+        # both branches share the same elbow construction (vertical ->
+        # horizontal -> vertical); delegate to the pure scalar kernel.
+        # The casts are sound per the readiness check above
+        paths = _bi_branch_paths(
+            Ax2,
+            Ay2,
+            cast(float, left_box.xCenter),
+            cast(float, left_box.yCenter),
+            cast(float, left_box.yTop),
+            cast(float, left_box.yBottom),
+            cast(float, right_box.xCenter),
+            cast(float, right_box.yCenter),
+            cast(float, right_box.yTop),
+            cast(float, right_box.yBottom),
+            tip_offset,
         )
-
-        # create the rightward arrow
-        Rx1 = Ax2
-        Ry1 = Ay2
-        Rx2 = right_box.xCenter
-        Ry2 = Ry1
-        Rx3 = Rx2
-        Ry3 = (
-            right_box.yTop + tip_offset
-            if Ay2 > right_box.yCenter
-            else right_box.yBottom - tip_offset
-        )
-
-        # set paths
-        path_left = [(Lx1, Ly1), (Lx2, Ly2), (Lx3, Ly3)]
-        path_right = [(Rx1, Ry1), (Rx2, Ry2), (Rx3, Ry3)]
-
-        return path_left, path_right
+        return list(paths[0]), list(paths[1])
 
     def add_box(
         self,
@@ -301,10 +619,11 @@ class LogicTree:
         fs: Optional[int] = None,
         font_weight: Optional[float] = None,
         lw: float = 1.6,
-        bbox_style: BoxStyle = BoxStyle("Round", pad=0.6),
+        bbox_style: Optional[BoxStyle] = None,
         va: Literal["top", "center", "bottom"] = "center",
         ha: Literal["left", "center", "right"] = "right",
         use_tex_rendering: bool = False,
+        force_usetex: bool = False,
         ul: bool = False,
         ul_depth_width: Optional[Tuple[float, float]] = None,
         angle: float = 0.0,
@@ -337,13 +656,21 @@ class LogicTree:
         lw : float, optional
             Line width of the box outline. Default is 1.6.
         bbox_style : matplotlib.patches.BoxStyle, optional
-            Shape and padding style for the box. Default is BoxStyle("Round", pad=0.6).
+            Shape and padding style for the box. If None, a shared
+            BoxStyle("Round", pad=0.6) instance is used.
         va : {'top', 'center', 'bottom'}, optional
             Vertical alignment of text within the box. Default is 'center'.
         ha : {'left', 'center', 'right'}, optional
             Horizontal alignment of text. Default is 'right'.
         use_tex_rendering : bool, optional
-            If True, enables LaTeX rendering for the box text. Requires proper LaTeX installation.
+            If True, enables LaTeX rendering for the box text. When the text uses
+            only mathtext-compatible constructs, it is rendered with matplotlib's
+            built-in mathtext engine instead, avoiding a `latex` subprocess per
+            string. Text requiring a real LaTeX installation (e.g. `\\bigsymbol`)
+            still goes through usetex.
+        force_usetex : bool, optional
+            If True (and `use_tex_rendering=True`), always use the external LaTeX
+            toolchain, skipping the mathtext fast path. Default is False.
         ul : bool, optional
             If True, applies underlining to the box text using LaTeX.
         ul_depth_width : tuple of (float, float), optional
@@ -366,33 +693,49 @@ class LogicTree:
                 f"Box name '{box_name}' already exists. Please use a unique name."
             )
 
-        # option to use latex rendering (minimal font options with latex, so not default)
-        if use_tex_rendering:
-            # our latex preamble for importing latex packages and making a command
-            # \bigsymbol{} for enlarging latex math symbols
-            latex_preamble = (
-                r"\usepackage{bm}"
-                r"\usepackage{amsmath}"
-                r"\usepackage{soul}"
-                r"\setul{2pt}{1pt}"
-                r"\usepackage{relsize}"
-                r"\newcommand{\bigsymbol}[1]{\mathlarger{\mathlarger{\mathlarger{#1}}}}"
-            )
-
-            # update rcParams to use latex
-            plt.rcParams.update(
-                {
-                    "text.usetex": True,
-                    "font.family": "cm",
-                    "text.latex.preamble": latex_preamble,
-                }
-            )
-        else:
-            plt.rcParams.update({"text.usetex": False})
+        if bbox_style is None:
+            bbox_style = _boxstyle("Round", 0.6)
+
+        # matplotlib's usetex path shells out to `latex`/`dvipng` per string,
+        # which dominates figure build time; when the text only uses constructs
+        # mathtext can render, rewrite it and skip usetex entirely. A custom
+        # \setul depth/width only takes effect through real LaTeX (the drawn
+        # underline emulation below cannot honor it), so it forces usetex
+        use_mathtext = (
+            use_tex_rendering
+            and not force_usetex
+            and ul_depth_width is None
+            and _mathtext_compatible(text)
+        )
+        if use_mathtext:
+            text = _rewrite_for_mathtext(text)
+        want_usetex = use_tex_rendering and not use_mathtext
+
+        # option to use latex rendering (minimal font options with latex, so not
+        # default). rcParams.update is slow (validation, callbacks) and toggling
+        # text.usetex invalidates matplotlib's TeX cache, so only touch the
+        # params when the requested TeX state actually changes.
+        if self._tex_state != want_usetex:
+            if want_usetex:
+                plt.rcParams.update(
+                    {
+                        "text.usetex": True,
+                        "font.family": "cm",
+                        "text.latex.preamble": _LATEX_PREAMBLE,
+                    }
+                )
+            else:
+                plt.rcParams.update({"text.usetex": False})
+            self._tex_state = want_usetex
 
-        # set fontidct of not provided
+        # set fontdict if not provided; the shared default dict is only read
+        # downstream, so it is copied only when a per-box override will
+        # mutate it - the common default call avoids the allocation entirely
         if font_dict is None:
-            font_dict = self.font_dict.copy()
+            if text_color is None and fs is None and font_weight is None:
+                font_dict = self.font_dict
+            else:
+                font_dict = self.font_dict.copy()
         # if specific text color is specified, change it in font_dict
         if text_color is not None:
             font_dict["color"] = text_color
@@ -419,19 +762,16 @@ class LogicTree:
             angle=angle,
         )
 
-        # add latex commands to text for underlining
-        if use_tex_rendering and (ul or ul_depth_width is not None):
-            text_str = r"\ul{" + myBox.text + r"}"
-            # if underlining parameters are set, add the command to change them
+        # add latex commands to text for underlining, in a single f-string pass
+        # (if underlining parameters are set, prepend the command to change them)
+        if want_usetex and (ul or ul_depth_width is not None):
             if ul_depth_width is not None:
                 text_str = (
-                    r"\setul{"
-                    + f"{ul_depth_width[0]}"
-                    + r"}{"
-                    + f"{ul_depth_width[1]}"
-                    + r"}"
-                    + text_str
+                    f"\\setul{{{ul_depth_width[0]}}}{{{ul_depth_width[1]}}}"
+                    f"\\ul{{{myBox.text}}}"
                 )
+            else:
+                text_str = f"\\ul{{{myBox.text}}}"
         else:
             text_str = myBox.text
         # make the text
@@ -446,30 +786,95 @@ class LogicTree:
             rotation=myBox.angle,
         )
 
-        # Ensure the figure is rendered so bbox extents are valid
-        self.fig.canvas.draw()
-
-        # Get the full bounding box of the text box (includes padding and styling)
-        bbox_patch = txt.get_bbox_patch()
-        if bbox_patch is None:
-            raise ValueError("Text object has no bounding box patch.")
-
-        # Convert the patch bbox from display to data coordinates
-        bbox_data = self.ax.transData.inverted().transform_bbox(
-            bbox_patch.get_window_extent(renderer=self.fig.canvas.get_renderer())  # type: ignore
+        # the measured extent depends only on the rendered string, font, box
+        # style, and alignment - not on position - so identical labels can
+        # reuse offsets measured once, skipping the draw round-trip below.
+        # Any font property except color can affect metrics (family, style,
+        # stretch, ...), so the key carries the whole font_dict
+        extent_key = (
+            text_str,
+            tuple(sorted((k, v) for k, v in font_dict.items() if k != "color")),
+            type(bbox_style).__name__,
+            getattr(bbox_style, "pad", None),
+            lw,
+            va,
+            ha,
+            angle,
+            want_usetex,
         )
+        # empty strings produce a degenerate, position-independent patch bbox,
+        # so anchor-relative offsets only hold for non-empty labels
+        try:
+            cached_extent = self._extent_cache.get(extent_key) if text_str else None
+        except TypeError:
+            # unhashable font_dict value; measure without caching
+            cached_extent = None
+            text_str_cacheable = False
+        else:
+            text_str_cacheable = bool(text_str)
+        if cached_extent is not None:
+            dxL, dxR, dyB, dyT = cached_extent
+            myBox.xLeft, myBox.xRight = xpos + dxL, xpos + dxR
+            myBox.yBottom, myBox.yTop = ypos + dyB, ypos + dyT
+        else:
+            # lay out just this text's bbox patch instead of redrawing the
+            # whole figure; this computes the same geometry Text.draw would.
+            # Empty labels are skipped the same way Text.draw skips them,
+            # leaving the degenerate default patch bbox
+            if text_str:
+                txt.update_bbox_position_size(self._renderer)
+
+            # Get the full bounding box of the text box (includes padding and styling)
+            bbox_patch = txt.get_bbox_patch()
+            if bbox_patch is None:
+                raise ValueError("Text object has no bounding box patch.")
+
+            # Convert the patch bbox from display to data coordinates using the
+            # renderer and inverse transform cached in __init__
+            bbox_data = self._inv_transData.transform_bbox(
+                bbox_patch.get_window_extent(renderer=self._renderer)
+            )
 
-        # Set box dimensions and positions
-        myBox.xLeft, myBox.xRight = bbox_data.x0, bbox_data.x1
-        myBox.yBottom, myBox.yTop = bbox_data.y0, bbox_data.y1
+            # Set box dimensions and positions
+            myBox.xLeft, myBox.xRight = bbox_data.x0, bbox_data.x1
+            myBox.yBottom, myBox.yTop = bbox_data.y0, bbox_data.y1
+            if text_str_cacheable:
+                self._extent_cache[extent_key] = (
+                    bbox_data.x0 - xpos,
+                    bbox_data.x1 - xpos,
+                    bbox_data.y0 - ypos,
+                    bbox_data.y1 - ypos,
+                )
         myBox.width = myBox.xRight - myBox.xLeft
         myBox.height = myBox.yTop - myBox.yBottom
         myBox.xCenter = (myBox.xLeft + myBox.xRight) / 2
         myBox.yCenter = (myBox.yBottom + myBox.yTop) / 2
+        myBox._layout_ready = True
+
+        # usetex was skipped, so emulate LaTeX's \ul by drawing a thin line
+        # along the bottom of the measured text extent (a ul_depth_width
+        # override never reaches this branch - it forces usetex above)
+        if use_mathtext and ul:
+            text_bbox = self._inv_transData.transform_bbox(
+                txt.get_window_extent(renderer=self._renderer)
+            )
+            self.ax.add_line(
+                Line2D(
+                    [text_bbox.x0, text_bbox.x1],
+                    [text_bbox.y0, text_bbox.y0],
+                    color=font_dict.get("color", "black"),
+                    linewidth=1.0,
+                    zorder=txt.get_zorder(),
+                )
+            )
 
         # store box in our LogicTree object's box dictionary to grab dimensions when needed
         self.boxes[myBox.name] = myBox
 
+        # boxes are only ever added, so the far extents update in O(1)
+        self._xFarLeft = min(self._xFarLeft, cast(float, myBox.xLeft))
+        self._xFarRight = max(self._xFarRight, cast(float, myBox.xRight))
+
         return myBox
 
     def add_arrow(self, arrow: ArrowETC, fill_arrow: bool = True) -> None:
@@ -499,7 +904,154 @@ class LogicTree:
             raise ValueError("ArrowETC must have a path with at least two points.")
 
         self.arrows.append(arrow)
-        self.ax = arrow.draw_to_ax(self.ax, fill_arrow=fill_arrow)
+
+        if self._batching:
+            # build the artists directly and defer drawing to finish_batch()
+            if fill_arrow:
+                poly = Polygon(
+                    arrow.vertices,
+                    closed=True,
+                    facecolor=arrow.fc,
+                    edgecolor="none",
+                    zorder=arrow.zorder,
+                )
+                poly.set_animated(True)
+                self.ax.add_patch(poly)
+                self._pending_artists.append(poly)
+            # same guard as ArrowETC.draw_to_ax: a sub-visible stroke on a
+            # filled arrow adds an artist without changing the rendered shape
+            if not (fill_arrow and arrow.lw <= 0.05):
+                line = Line2D(
+                    arrow.x_vertices,
+                    arrow.y_vertices,
+                    color=arrow.ec,
+                    linewidth=arrow.lw,
+                    linestyle=arrow.ls,
+                    zorder=arrow.zorder,
+                )
+                line.set_animated(True)
+                self.ax.add_line(line)
+                self._pending_artists.append(line)
+        elif self._defer_render:
+            # accumulate raw geometry; render() batches it into collections.
+            # ArrowETC already stores the polygon as an (N, 2) array, which is
+            # exactly what the collections consume - no restacking needed.
+            verts = arrow.vertices
+            if fill_arrow:
+                self._fill_polys.append(verts)
+                self._fill_colors.append(arrow.fc)
+                self._fill_zorders.append(arrow.zorder)
+            # same guard as ArrowETC.draw_to_ax: sub-visible strokes on
+            # filled arrows would only bloat the outline LineCollection
+            if not (fill_arrow and arrow.lw <= 0.05):
+                self._line_segs.append(verts)
+                self._line_colors.append(arrow.ec)
+                self._line_widths.append(float(arrow.lw))
+                self._line_styles.append(arrow.ls)
+                self._line_zorders.append(arrow.zorder)
+        else:
+            self.ax = arrow.draw_to_ax(self.ax, fill_arrow=fill_arrow)
+
+    def render(self) -> None:
+        """
+        Flush deferred arrow geometry onto the axes as two batched collections.
+
+        When the tree was created with `defer_render=True`, each arrow's fill
+        polygon and outline are accumulated rather than drawn. This method
+        draws all accumulated fills as one PolyCollection and all outlines as
+        one LineCollection per distinct zorder, collapsing ~2N artists into
+        2 for N arrows sharing a stacking level. It is called automatically
+        by `save_as_png` and is a no-op when there is nothing pending.
+        """
+        if self._fill_polys:
+            # a collection has a single zorder, so group arrows by theirs to
+            # preserve each arrow's stacking level; trees use only a handful
+            # of distinct zorders, so this still yields ~one collection
+            fill_groups: Dict[float, List[int]] = {}
+            for i, z in enumerate(self._fill_zorders):
+                fill_groups.setdefault(z, []).append(i)
+            for z, idxs in fill_groups.items():
+                self.ax.add_collection(
+                    PolyCollection(
+                        [self._fill_polys[i] for i in idxs],
+                        closed=False,  # arrow polygons are already closed
+                        facecolors=[self._fill_colors[i] for i in idxs],
+                        edgecolors="none",
+                        zorder=z,
+                    )
+                )
+            self._fill_polys = []
+            self._fill_colors = []
+            self._fill_zorders = []
+        if self._line_segs:
+            line_groups: Dict[float, List[int]] = {}
+            for i, z in enumerate(self._line_zorders):
+                line_groups.setdefault(z, []).append(i)
+            for z, idxs in line_groups.items():
+                self.ax.add_collection(
+                    LineCollection(
+                        [self._line_segs[i] for i in idxs],
+                        colors=[self._line_colors[i] for i in idxs],
+                        linewidths=[self._line_widths[i] for i in idxs],
+                        linestyles=[self._line_styles[i] for i in idxs],
+                        zorder=z,
+                    )
+                )
+            self._line_segs = []
+            self._line_colors = []
+            self._line_widths = []
+            self._line_styles = []
+            self._line_zorders = []
+
+    def begin_batch(self) -> None:
+        """
+        Start a blitting-based batch of connection draws.
+
+        The LogicTree axes are static (ticks off, fixed limits), so the figure
+        background only needs to be rendered once per batch. Between
+        `begin_batch()` and `finish_batch()`, arrows added via `add_arrow()`
+        (and therefore all `add_connection*` methods) are created as animated
+        artists and accumulated instead of triggering a full redraw each.
+
+        Notes
+        -----
+        Must be paired with a call to `finish_batch()` to actually render the
+        accumulated artists onto the canvas.
+        """
+        self.fig.canvas.draw()
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)  # type: ignore[attr-defined]
+        self._pending_artists = []
+        self._batching = True
+
+    def finish_batch(self) -> None:
+        """
+        Finish a batch started with `begin_batch()` and blit all pending artists.
+
+        Restores the cached background region, draws each accumulated artist
+        directly, then blits the axes region once. For N connections this turns
+        N full re-renders into a single background restore plus N cheap artist
+        draws.
+
+        Raises
+        ------
+        RuntimeError
+            If called without a preceding `begin_batch()`.
+        """
+        if not self._batching:
+            raise RuntimeError("finish_batch() called without begin_batch().")
+
+        self.fig.canvas.restore_region(self._background)  # type: ignore[attr-defined]
+        for artist in self._pending_artists:
+            self.ax.draw_artist(artist)
+            # hand the artist back to the normal draw tree: animated artists
+            # are skipped by interactive repaints (resize, show), so leaving
+            # the flag set would make every batched connection vanish there
+            artist.set_animated(False)
+        self.fig.canvas.blit(self.ax.bbox)
+
+        self._batching = False
+        self._pending_artists = []
+        self._background = None
 
     def add_arrow_between(
         self,
@@ -516,7 +1068,7 @@ class LogicTree:
         ec: str = "black",
         zorder: float = 1.0,
         lw: float = 1.0,
-        ls: str = "-",
+        ls: LineStyleType = "-",
         fill_arrow: bool = True,
     ) -> None:
         """
@@ -553,8 +1105,9 @@ class LogicTree:
             Drawing order for the arrow. Higher values appear on top. Default is 1.0.
         lw : float, optional
             Line width for the arrow outline. Default is 1.0.
-        ls : str, optional
-            Line style for the outline (e.g., "-", "--"). Default is "-".
+        ls : str or tuple, optional
+            Line style for the outline (e.g., "-", "--", or an offset/dash
+            tuple). Default is "-".
         fill_arrow : bool, optional
             Whether to fill the interior of the arrow. Default is True.
 
@@ -566,19 +1119,19 @@ class LogicTree:
         if start == end:
             raise ValueError("Arrow start and end points must differ.")
 
-        # Vector from start to end
-        dx = end[0] - start[0]
-        dy = end[1] - start[1]
-        length = hypot(dx, dy)
-
-        # Unit direction vector
-        ux, uy = dx / length, dy / length
-
-        # Apply offsets
-        new_start = (start[0] + ux * butt_offset, start[1] + uy * butt_offset)
-        new_end = (end[0] - ux * tip_offset, end[1] - uy * tip_offset)
-
-        path = [new_start, new_end]
+        # offsets shift the endpoints along the unit direction vector; skip
+        # the normalization entirely in the common no-offset case
+        if butt_offset == 0 and tip_offset == 0:
+            path = [start, end]
+        else:
+            dx = end[0] - start[0]
+            dy = end[1] - start[1]
+            inv_len = 1.0 / hypot(dx, dy)
+            ux, uy = dx * inv_len, dy * inv_len
+            path = [
+                (start[0] + ux * butt_offset, start[1] + uy * butt_offset),
+                (end[0] - ux * tip_offset, end[1] - uy * tip_offset),
+            ]
         arrow = ArrowETC(
             ax=self.ax,
             path=path,
@@ -676,128 +1229,95 @@ class LogicTree:
         This method is useful for visualizing binary decisions or logical forks in flow diagrams.
         Each arrow path consists of three segments: vertical stem → horizontal split → vertical drop.
         """
-        if (
-            boxA.xLeft is None
-            or boxA.xCenter is None
-            or boxA.xRight is None
-            or boxA.yTop is None
-            or boxA.yCenter is None
-            or boxA.yBottom is None
-        ):
-            raise ValueError(
-                "boxA LogicBox layout is not initialized before accessing coordinates."
-            )
-        if (
-            boxB.xLeft is None
-            or boxB.xCenter is None
-            or boxB.xRight is None
-            or boxB.yTop is None
-            or boxB.yCenter is None
-            or boxB.yBottom is None
-        ):
-            raise ValueError(
-                "boxB LogicBox layout is not initialized before accessing coordinates."
-            )
-        if (
-            boxC.xLeft is None
-            or boxC.xCenter is None
-            or boxC.xRight is None
-            or boxC.yTop is None
-            or boxC.yCenter is None
-            or boxC.yBottom is None
-        ):
-            raise ValueError(
-                "boxC LogicBox layout is not initialized before accessing coordinates."
-            )
-
-        # Resolve text styling
-        if text_kwargs is None:
-            text_kwargs = {}
-        fontname = text_kwargs.get("fontname", "sans-serif")
-        fontsize = text_kwargs.get("fontsize", 12)
-        fontcolor = text_kwargs.get("color", "white")
-        fontstyle = text_kwargs.get("fontstyle", "normal")
-
-        def annotate_segment(
-            text: Optional[str],
-            path: list[tuple[float, float]],
-            offset: Literal["above", "below"],
-        ) -> None:
-            """
-            Place text at the midpoint of a given arrow segment, offset vertically above or below.
-
-            Parameters
-            ----------
-            text : str, optional
-                The text to render. If None or empty, nothing is drawn.
-            path : list of (float, float)
-                The path representing the arrow segment.
-            offset : {'above', 'below'}
-                Whether the label is placed above or below the arrow shaft.
-            """
-            if not text:
-                return
-            (x1, y1), (x2, _) = path[0], path[-1]
-            xm = (x1 + x2) / 2 + (
-                0.2 * shaft_width / 2 if x1 < x2 else -0.2 * shaft_width / 2
-            )
-            ym = y1 + shaft_width * 0.2 if offset == "above" else y1 - shaft_width * 0.2
-            va = "bottom" if offset == "above" else "top"
-            self.ax.text(
-                xm,
-                ym,
-                text,
-                ha="center",
-                va=va,
-                fontsize=fontsize,
-                fontname=fontname,
-                color=fontcolor,
-                fontstyle=fontstyle,
-            )
-
-        def resolve_colors(
-            box: LogicBox, fc: Optional[str], ec: Optional[str]
-        ) -> tuple[Optional[str], str]:
-            """
-            Resolve fill and edge color settings using box defaults and shorthand keywords.
-
-            Parameters
-            ----------
-            box : LogicBox
-                The box used to provide default or fallback colors.
-            fc : str, optional
-                The face color. Can be None, "ec", or a valid color string.
-            ec : str, optional
-                The edge color. Can be None, "fc", or a valid color string.
-
-            Returns
-            -------
-            tuple of (str, str)
-                The resolved face color and edge color.
-            """
-            if fill_connection:
-                fc = (
-                    box.edge_color
-                    if fc == "ec"
-                    else (box.face_color if fc is None else fc)
+        # add_box always populates the layout coordinates, so one flag read
+        # per box replaces six attribute/None comparisons each
+        for label_, box_ in (("boxA", boxA), ("boxB", boxB), ("boxC", boxC)):
+            if not box_._layout_ready:
+                raise ValueError(
+                    f"{label_} LogicBox layout is not initialized before "
+                    "accessing coordinates."
                 )
-            ec = (
-                box.face_color if ec == "fc" else (box.edge_color if ec is None else ec)
-            )
 
-            return fc, ec
+        # bind the coordinates this method needs to plain float locals; the
+        # casts are sound per the readiness check above
+        boxA_xc = cast(float, boxA.xCenter)
+        boxA_yc = cast(float, boxA.yCenter)
+        boxA_yt = cast(float, boxA.yTop)
+        boxA_yb = cast(float, boxA.yBottom)
+        boxB_xc = cast(float, boxB.xCenter)
+        boxB_yc = cast(float, boxB.yCenter)
+        boxB_yt = cast(float, boxB.yTop)
+        boxB_yb = cast(float, boxB.yBottom)
+        boxC_xc = cast(float, boxC.xCenter)
+        boxC_yc = cast(float, boxC.yCenter)
+        boxC_yt = cast(float, boxC.yTop)
+        boxC_yb = cast(float, boxC.yBottom)
+
+        # Resolve text styling and build the label helper only when a label
+        # will actually render; most bi-splits carry no text at all
+        annotate_segment: Optional[
+            Callable[[Optional[str], list[tuple[float, float]], str], None]
+        ] = None
+        if textLeft or textRight:
+            if text_kwargs is None:
+                text_kwargs = {}
+            fontname = text_kwargs.get("fontname", "sans-serif")
+            fontsize = text_kwargs.get("fontsize", 12)
+            fontcolor = text_kwargs.get("color", "white")
+            fontstyle = text_kwargs.get("fontstyle", "normal")
+
+            def annotate_segment(
+                text: Optional[str],
+                path: list[tuple[float, float]],
+                offset: str,
+            ) -> None:
+                """
+                Place text at the midpoint of a given arrow segment, offset vertically above or below.
+
+                Parameters
+                ----------
+                text : str, optional
+                    The text to render. If None or empty, nothing is drawn.
+                path : list of (float, float)
+                    The path representing the arrow segment.
+                offset : {'above', 'below'}
+                    Whether the label is placed above or below the arrow shaft.
+                """
+                if not text:
+                    return
+                (x1, y1), (x2, _) = path[0], path[-1]
+                xm = (x1 + x2) / 2 + (
+                    0.2 * shaft_width / 2 if x1 < x2 else -0.2 * shaft_width / 2
+                )
+                ym = (
+                    y1 + shaft_width * 0.2
+                    if offset == "above"
+                    else y1 - shaft_width * 0.2
+                )
+                va = "bottom" if offset == "above" else "top"
+                self.ax.text(
+                    xm,
+                    ym,
+                    text,
+                    ha="center",
+                    va=va,
+                    fontsize=fontsize,
+                    fontname=fontname,
+                    color=fontcolor,
+                    fontstyle=fontstyle,
+                )
 
-        fc_A, ec_A = resolve_colors(boxA, fc_A, ec_A)
-        fc_B, ec_B = resolve_colors(boxB, fc_B, ec_B)
-        fc_C, ec_C = resolve_colors(boxC, fc_C, ec_C)
+        fc_A, ec_A = _resolve_colors(boxA, fc_A, ec_A, fill_connection)
+        fc_B, ec_B = _resolve_colors(boxB, fc_B, ec_B, fill_connection)
+        fc_C, ec_C = _resolve_colors(boxC, fc_C, ec_C, fill_connection)
 
         # Determine vertical direction of arrows
-        if boxA.yCenter > boxB.yCenter and boxA.yCenter > boxC.yCenter:
-            Ax1, Ay1 = boxA.xCenter, boxA.yBottom - butt_offset
-            Ay2 = (Ay1 + max(boxB.yTop, boxC.yTop)) / 2
-        elif boxA.yCenter < boxB.yCenter and boxA.yCenter < boxC.yCenter:
-            Ax1, Ay1 = boxA.xCenter, boxA.yTop + butt_offset
-            Ay2 = (Ay1 + min(boxB.yBottom, boxC.yBottom)) / 2
+        if boxA_yc > boxB_yc and boxA_yc > boxC_yc:
+            Ax1, Ay1 = boxA_xc, boxA_yb - butt_offset
+            Ay2 = (Ay1 + max(boxB_yt, boxC_yt)) / 2
+        elif boxA_yc < boxB_yc and boxA_yc < boxC_yc:
+            Ax1, Ay1 = boxA_xc, boxA_yt + butt_offset
+            Ay2 = (Ay1 + min(boxB_yb, boxC_yb)) / 2
         else:
             raise ValueError("boxA must be clearly above or below both boxB and boxC.")
 
@@ -815,23 +1335,21 @@ class LogicTree:
         self.add_arrow(arrow)
 
         # Determine left/right order
-        left_box, right_box = (
-            (boxB, boxC) if boxB.xCenter < boxC.xCenter else (boxC, boxB)
-        )
+        left_box, right_box = (boxB, boxC) if boxB_xc < boxC_xc else (boxC, boxB)
         path_left, path_right = self._get_pathsForBi_left_then_right(
             Ax2, Ay2, left_box=left_box, right_box=right_box, tip_offset=tip_offset
         )
 
-        def draw_branch(
+        def build_branch(
             path: list[tuple[float, float]],
             ec: str,
             fc: str,
             lw: float,
             label: Optional[str],
             label_offset: Literal["above", "below"],
-        ) -> None:
+        ) -> ArrowETC:
             """
-            Draw a single arrow branch with optional fill and text annotation.
+            Build a single arrow branch and place its optional text annotation.
 
             Parameters
             ----------
@@ -845,6 +1363,11 @@ class LogicTree:
                 Optional text to annotate the arrow shaft.
             label_offset : {'above', 'below'}
                 Vertical position of the text relative to the arrow shaft.
+
+            Returns
+            -------
+            ArrowETC
+                The constructed (not yet drawn) branch arrow.
             """
             arrow = ArrowETC(
                 ax=self.ax,
@@ -857,44 +1380,53 @@ class LogicTree:
                 close_tail=False,
                 zorder=1000,
             )
-            self.add_arrow(arrow)
-            annotate_segment(label, path, label_offset)
+            if annotate_segment is not None:
+                annotate_segment(label, path, label_offset)
+            return arrow
 
-        # Draw left
+        # pair each branch with the colors of the box it points at, then build
+        # left followed by right with a single parameterized loop
         if left_box is boxB:
-            draw_branch(
-                path_left,
-                cast(str, ec_B),
-                cast(str, fc_B),
-                lw,
-                textLeft,
-                textLeftOffset,
-            )
-            draw_branch(
-                path_right,
-                cast(str, ec_C),
-                cast(str, fc_C),
-                lw,
-                textRight,
-                textRightOffset,
-            )
+            colors_left, colors_right = (ec_B, fc_B), (ec_C, fc_C)
         else:
-            draw_branch(
-                path_left,
-                cast(str, ec_C),
-                cast(str, fc_C),
-                lw,
-                textLeft,
-                textLeftOffset,
+            colors_left, colors_right = (ec_C, fc_C), (ec_B, fc_B)
+
+        branches = [
+            build_branch(path, cast(str, ec), cast(str, fc), lw, label, label_offset)
+            for path, (ec, fc), label, label_offset in (
+                (path_left, colors_left, textLeft, textLeftOffset),
+                (path_right, colors_right, textRight, textRightOffset),
             )
-            draw_branch(
-                path_right,
-                cast(str, ec_B),
-                cast(str, fc_B),
-                lw,
-                textRight,
-                textRightOffset,
+        ]
+
+        if (
+            colors_left == colors_right
+            and not self._batching
+            and not self._defer_render
+        ):
+            # both branches share one style, so fuse their polygons into a
+            # single compound Path (MOVETO breaks between them) and dispatch
+            # one patch instead of two fills plus two outlines
+            self.arrows.extend(branches)
+            verts = np.vstack([arrow.vertices for arrow in branches])
+            codes = np.full(len(verts), MplPath.LINETO, dtype=MplPath.code_type)
+            start = 0
+            for arrow in branches:
+                codes[start] = MplPath.MOVETO
+                start += len(arrow.vertices)
+            ec_shared, fc_shared = colors_left
+            self.ax.add_patch(
+                PathPatch(
+                    MplPath(verts, codes),
+                    facecolor=fc_shared if fc_shared else "none",
+                    edgecolor=ec_shared,
+                    linewidth=lw,
+                    zorder=1000,
+                )
             )
+        else:
+            for arrow in branches:
+                self.add_arrow(arrow)
 
     def _get_side_coords(
         self, box: LogicBox, side: str, offset: float = 0.0
@@ -928,39 +1460,133 @@ class LogicTree:
             If `side` is not a recognized keyword.
         """
 
-        if (
-            box.xLeft is None
-            or box.xCenter is None
-            or box.xRight is None
-            or box.yTop is None
-            or box.yCenter is None
-            or box.yBottom is None
-        ):
+        if not box._layout_ready:
             raise ValueError(
                 "box LogicBox layout is not initialized before accessing coordinates."
             )
 
-        match side:
-            case "left":
-                return box.xLeft - offset, box.yCenter
-            case "right":
-                return box.xRight + offset, box.yCenter
-            case "top":
-                return box.xCenter, box.yTop + offset
-            case "bottom":
-                return box.xCenter, box.yBottom - offset
-            case "center":
-                return box.xCenter, box.yCenter
-            case "topLeft":
-                return box.xLeft - offset, box.yTop + offset
-            case "topRight":
-                return box.xRight + offset, box.yTop + offset
-            case "bottomLeft":
-                return box.xLeft - offset, box.yBottom - offset
-            case "bottomRight":
-                return box.xRight + offset, box.yBottom - offset
-            case _:
-                raise ValueError(f"Invalid side: '{side}'")
+        anchor = _SIDE_ANCHORS.get(side)
+        if anchor is None:
+            raise ValueError(f"Invalid side: '{side}'")
+        x_attr, y_attr, sx, sy = anchor
+        return (
+            getattr(box, x_attr) + sx * offset,
+            getattr(box, y_attr) + sy * offset,
+        )
+
+    def _resolve_connection_endpoints(
+        self,
+        boxA: LogicBox,
+        boxB: Union[LogicBox, Tuple[float, float]],
+        sideA: Optional[str],
+        sideB: Optional[str],
+        butt_offset: float,
+        tip_offset: float,
+        fc: Optional[str],
+        ec: Optional[str],
+        fill_connection: bool,
+    ) -> Tuple[
+        Tuple[float, float],
+        Tuple[float, float],
+        Optional[str],
+        Optional[str],
+        float,
+        float,
+    ]:
+        """
+        Resolve shared connection setup: validation, colors, sides, and offsets.
+
+        `add_connection` and `add_bezier_connection` perform identical work to
+        turn two endpoints into concrete start/end coordinates; this helper
+        centralizes it so the per-call cost is paid once and in one place.
+
+        Parameters
+        ----------
+        boxA : LogicBox
+            The source box where the connection begins.
+        boxB : LogicBox or tuple of float
+            The destination - another LogicBox or a fixed (x, y) coordinate.
+        sideA, sideB : str, optional
+            Explicit attachment sides; inferred from the connection angle
+            when None.
+        butt_offset, tip_offset : float
+            Outward offsets applied to the start and end points.
+        fc, ec : str, optional
+            Fill/edge color overrides; resolved from `boxB` when None and
+            `boxB` is a LogicBox.
+        fill_connection : bool
+            Whether the arrow body will be filled (affects color resolution).
+
+        Returns
+        -------
+        tuple
+            `(start, end, fc, ec, dx, dy)` where `start`/`end` are (x, y)
+            coordinates and `dx`/`dy` is the center-to-center direction.
+
+        Raises
+        ------
+        ValueError
+            If either box layout is uninitialized or the boxes share a center.
+        """
+        if not boxA._layout_ready:
+            raise ValueError(
+                "boxA LogicBox layout is not initialized before accessing coordinates."
+            )
+
+        boxA_xc = cast(float, boxA.xCenter)
+        boxA_yc = cast(float, boxA.yCenter)
+        if isinstance(boxB, LogicBox):
+            if not boxB._layout_ready:
+                raise ValueError(
+                    "boxB LogicBox layout is not initialized before accessing "
+                    "coordinates."
+                )
+            fc, ec = _resolve_colors(boxB, fc, ec, fill_connection)
+
+            if boxA_xc == boxB.xCenter and boxA_yc == boxB.yCenter:
+                raise ValueError("Boxes cannot have the same position.")
+
+            dx = cast(float, boxB.xCenter) - boxA_xc
+            dy = cast(float, boxB.yCenter) - boxA_yc
+        else:
+            # boxB is a coordinate point
+            xB, yB = boxB
+            dx = xB - boxA_xc
+            dy = yB - boxA_yc
+
+        autoA, autoB = _auto_sides(dx, dy)
+        resolved_sideA = sideA or autoA
+        resolved_sideB = sideB or autoB
+
+        # inline the _get_side_coords lookup: both boxes were validated
+        # above, so only the anchor probe remains (auto sides are always
+        # valid; explicit sides still raise on unknown names)
+        anchors = _SIDE_ANCHORS
+        anchorA = anchors.get(resolved_sideA)
+        if anchorA is None:
+            raise ValueError(f"Invalid side: '{resolved_sideA}'")
+        start = (getattr(boxA, anchorA[0]), getattr(boxA, anchorA[1]))
+        if isinstance(boxB, LogicBox):
+            anchorB = anchors.get(resolved_sideB)
+            if anchorB is None:
+                raise ValueError(f"Invalid side: '{resolved_sideB}'")
+            end = (getattr(boxB, anchorB[0]), getattr(boxB, anchorB[1]))
+        else:
+            # coordinate endpoints skip the anchor lookup but still apply the
+            # tip offset below, so an explicit side must be validated here too
+            if resolved_sideB not in anchors:
+                raise ValueError(f"Invalid side: '{resolved_sideB}'")
+            end = boxB  # (x, y) tuple
+
+        if butt_offset:
+            sx, sy = _SIDE_OFFSET_SIGNS[resolved_sideA]
+            start = (start[0] + sx * butt_offset, start[1] + sy * butt_offset)
+
+        if tip_offset:
+            sx, sy = _SIDE_OFFSET_SIGNS[resolved_sideB]
+            end = (end[0] + sx * tip_offset, end[1] + sy * tip_offset)
+
+        return start, end, fc, ec, dx, dy
 
     def add_connection(
         self,
@@ -1053,141 +1679,27 @@ class LogicTree:
         ValueError
             If box coordinates are missing or if the boxes have identical centers.
         """
-        if (
-            boxA.xLeft is None
-            or boxA.xCenter is None
-            or boxA.xRight is None
-            or boxA.yTop is None
-            or boxA.yCenter is None
-            or boxA.yBottom is None
-        ):
-            raise ValueError(
-                "boxA LogicBox layout is not initialized before accessing coordinates."
-            )
-
-        if isinstance(boxB, LogicBox):
-            if (
-                boxB.xLeft is None
-                or boxB.xCenter is None
-                or boxB.xRight is None
-                or boxB.yTop is None
-                or boxB.yCenter is None
-                or boxB.yBottom is None
-            ):
-                raise ValueError(
-                    "boxB LogicBox layout is not initialized before accessing coordinates."
-                )
-            if fill_connection:
-                if fc is None or fc == "fc":
-                    fc = boxB.face_color
-                elif fc == "ec":
-                    fc = boxB.edge_color
-            if ec is None or ec == "ec":
-                ec = boxB.edge_color
-            elif ec == "fc":
-                ec = boxB.face_color
-
-            if boxA.xCenter == boxB.xCenter and boxA.yCenter == boxB.yCenter:
-                raise ValueError("Boxes cannot have the same position.")
-
-            dx = boxB.xCenter - boxA.xCenter
-            dy = boxB.yCenter - boxA.yCenter
-        else:
-            # boxB is a coordinate point
-            xB, yB = boxB
-            dx = xB - boxA.xCenter
-            dy = yB - boxA.yCenter
-
-        theta = degrees(atan2(dy, dx))
-
-        def auto_side(theta: float, for_A: bool) -> str:
-            if -45 <= theta <= 45:
-                return "right" if for_A else "left"
-            elif 45 < theta <= 135:
-                return "top" if for_A else "bottom"
-            elif theta > 135 or theta < -135:
-                return "left" if for_A else "right"
-            else:
-                return "bottom" if for_A else "top"
-
-        resolved_sideA = sideA or auto_side(theta, for_A=True)
-        resolved_sideB = sideB or auto_side(theta, for_A=False)
-
-        start = self._get_side_coords(boxA, resolved_sideA)
-
-        if isinstance(boxB, LogicBox):
-            end = self._get_side_coords(boxB, resolved_sideB)
-        else:
-            end = boxB  # (x, y) tuple
-
-        if butt_offset:
-            match resolved_sideA:
-                case "left":
-                    start = (start[0] - butt_offset, start[1])
-                case "right":
-                    start = (start[0] + butt_offset, start[1])
-                case "top":
-                    start = (start[0], start[1] + butt_offset)
-                case "bottom":
-                    start = (start[0], start[1] - butt_offset)
-                case "topLeft":
-                    start = (start[0] - butt_offset, start[1] + butt_offset)
-                case "topRight":
-                    start = (start[0] + butt_offset, start[1] + butt_offset)
-                case "bottomLeft":
-                    start = (start[0] - butt_offset, start[1] - butt_offset)
-                case "bottomRight":
-                    start = (start[0] + butt_offset, start[1] - butt_offset)
-
-        if tip_offset:
-            match resolved_sideB:
-                case "left":
-                    end = (end[0] - tip_offset, end[1])
-                case "right":
-                    end = (end[0] + tip_offset, end[1])
-                case "top":
-                    end = (end[0], end[1] + tip_offset)
-                case "bottom":
-                    end = (end[0], end[1] - tip_offset)
-                case "topLeft":
-                    end = (end[0] - tip_offset, end[1] + tip_offset)
-                case "topRight":
-                    end = (end[0] + tip_offset, end[1] + tip_offset)
-                case "bottomLeft":
-                    end = (end[0] - tip_offset, end[1] - tip_offset)
-                case "bottomRight":
-                    end = (end[0] + tip_offset, end[1] - tip_offset)
+        start, end, fc, ec, _dx, _dy = self._resolve_connection_endpoints(
+            boxA, boxB, sideA, sideB, butt_offset, tip_offset, fc, ec, fill_connection
+        )
 
         if segmented:
+            yA = cast(float, boxA.yCenter)
+            xA = cast(float, boxA.xCenter)
             if isinstance(boxB, LogicBox):
-                if (
-                    boxB.xLeft is None
-                    or boxB.xCenter is None
-                    or boxB.xRight is None
-                    or boxB.yTop is None
-                    or boxB.yCenter is None
-                    or boxB.yBottom is None
-                ):
-                    raise ValueError(
-                        "boxB LogicBox layout is not initialized before accessing coordinates."
-                    )
-                yA = boxA.yCenter
-                yB = boxB.yCenter
-                xA = boxA.xCenter
-                xB = boxB.xCenter
+                yB = cast(float, boxB.yCenter)
+                xB = cast(float, boxB.xCenter)
             else:
-                yA = boxA.yCenter
                 yB = end[1]
-                xA = boxA.xCenter
                 xB = end[0]
 
             if yA == yB or xA == xB:
                 path = [start, end]
             elif yA < yB:
-                midY = (boxA.yTop + yB) / 2
+                midY = (cast(float, boxA.yTop) + yB) / 2
                 path = [start, (start[0], midY), (end[0], midY), end]
             else:
-                midY = (boxA.yBottom + yB) / 2
+                midY = (cast(float, boxA.yBottom) + yB) / 2
                 path = [start, (start[0], midY), (end[0], midY), end]
         else:
             path = [start, end]
@@ -1298,113 +1810,9 @@ class LogicTree:
             If box coordinates are uninitialized or the curve cannot be constructed.
         """
 
-        if (
-            boxA.xLeft is None
-            or boxA.xCenter is None
-            or boxA.xRight is None
-            or boxA.yTop is None
-            or boxA.yCenter is None
-            or boxA.yBottom is None
-        ):
-            raise ValueError(
-                "boxA LogicBox layout is not initialized before accessing coordinates."
-            )
-
-        if isinstance(boxB, LogicBox):
-            if (
-                boxB.xLeft is None
-                or boxB.xCenter is None
-                or boxB.xRight is None
-                or boxB.yTop is None
-                or boxB.yCenter is None
-                or boxB.yBottom is None
-            ):
-                raise ValueError(
-                    "boxB LogicBox layout is not initialized before accessing coordinates."
-                )
-
-            if fill_connection:
-                if fc is None or fc == "fc":
-                    fc = boxB.face_color
-                elif fc == "ec":
-                    fc = boxB.edge_color
-            if ec is None or ec == "ec":
-                ec = boxB.edge_color
-            elif ec == "fc":
-                ec = boxB.face_color
-
-            if boxA.xCenter == boxB.xCenter and boxA.yCenter == boxB.yCenter:
-                raise ValueError("Boxes cannot have the same position.")
-
-            dx = boxB.xCenter - boxA.xCenter
-            dy = boxB.yCenter - boxA.yCenter
-        else:
-            # boxB is a coordinate
-            xB, yB = boxB
-            dx = xB - boxA.xCenter
-            dy = yB - boxA.yCenter
-
-        theta = degrees(atan2(dy, dx))
-
-        def auto_side(theta: float, for_A: bool) -> str:
-            if -45 <= theta <= 45:
-                return "right" if for_A else "left"
-            elif 45 < theta <= 135:
-                return "top" if for_A else "bottom"
-            elif theta > 135 or theta < -135:
-                return "left" if for_A else "right"
-            else:
-                return "bottom" if for_A else "top"
-
-        resolved_sideA = sideA or auto_side(theta, for_A=True)
-        resolved_sideB = sideB or auto_side(theta, for_A=False)
-
-        start = self._get_side_coords(boxA, resolved_sideA)
-
-        if isinstance(boxB, LogicBox):
-            end = self._get_side_coords(boxB, resolved_sideB)
-        else:
-            end = boxB  # raw coordinate
-
-        # Apply butt offset
-        if butt_offset:
-            match resolved_sideA:
-                case "left":
-                    start = (start[0] - butt_offset, start[1])
-                case "right":
-                    start = (start[0] + butt_offset, start[1])
-                case "top":
-                    start = (start[0], start[1] + butt_offset)
-                case "bottom":
-                    start = (start[0], start[1] - butt_offset)
-                case "topLeft":
-                    start = (start[0] - butt_offset, start[1] + butt_offset)
-                case "topRight":
-                    start = (start[0] + butt_offset, start[1] + butt_offset)
-                case "bottomLeft":
-                    start = (start[0] - butt_offset, start[1] - butt_offset)
-                case "bottomRight":
-                    start = (start[0] + butt_offset, start[1] - butt_offset)
-
-        # Apply tip offset
-        if tip_offset:
-            match resolved_sideB:
-                case "left":
-                    end = (end[0] - tip_offset, end[1])
-                case "right":
-                    end = (end[0] + tip_offset, end[1])
-                case "top":
-                    end = (end[0], end[1] + tip_offset)
-                case "bottom":
-                    end = (end[0], end[1] - tip_offset)
-                case "topLeft":
-                    end = (end[0] - tip_offset, end[1] + tip_offset)
-                case "topRight":
-                    end = (end[0] + tip_offset, end[1] + tip_offset)
-                case "bottomLeft":
-                    end = (end[0] - tip_offset, end[1] - tip_offset)
-                case "bottomRight":
-                    end = (end[0] + tip_offset, end[1] - tip_offset)
+        start, end, fc, ec, dx, dy = self._resolve_connection_endpoints(
+            boxA, boxB, sideA, sideB, butt_offset, tip_offset, fc, ec, fill_connection
+        )
 
         if control_points is not None:
             path = [start] + control_points + [end]
@@ -1413,20 +1821,16 @@ class LogicTree:
                 case "smooth":
                     cx = (start[0] + end[0]) / 2
                     cy = (start[1] + end[1]) / 2
-                    normal = (-dy, dx)
-                    mag = (dx**2 + dy**2) ** 0.5 or 1e-6
-                    offset = 0.2 * mag
-                    ctrl = (
-                        cx + normal[0] / mag * offset,
-                        cy + normal[1] / mag * offset,
-                    )
+                    # offset the midpoint 20% of the span along the normal;
+                    # the magnitudes cancel, so no normalization is needed
+                    ctrl = (cx - 0.2 * dy, cy + 0.2 * dx)
                     path = [start, ctrl, end]
                 case "elbow":
                     ctrl1 = (end[0], start[1])
                     ctrl2 = (end[0], end[1])
                     path = [start, ctrl1, ctrl2]
                 case "s-curve":
-                    d = 0.3 * (dx**2 + dy**2) ** 0.5
+                    d = 0.3 * hypot(dx, dy)
                     ctrl1 = (
                         (2 * start[0] + end[0]) / 3,
                         (2 * start[1] + end[1]) / 3 - d,
@@ -1454,6 +1858,24 @@ class LogicTree:
         )
         self.add_arrow(arrow)
 
+    def invalidate_extents(self) -> None:
+        """
+        Recompute the cached far-left/far-right box extents from scratch.
+
+        `add_box` maintains the extents incrementally, which is correct as
+        long as boxes are only added. Call this after mutating LogicBox
+        layout attributes directly so `make_title(consider_box_x=True)`
+        sees the updated geometry.
+        """
+        self._xFarLeft = min(
+            (b.xLeft for b in self.boxes.values() if b.xLeft is not None),
+            default=float("inf"),
+        )
+        self._xFarRight = max(
+            (b.xRight for b in self.boxes.values() if b.xRight is not None),
+            default=float("-inf"),
+        )
+
     def make_title(
         self,
         pos: Literal["left", "center", "right"] = "left",
@@ -1489,48 +1911,19 @@ class LogicTree:
         if new_title is not None:
             self.title = new_title
 
-        # if we are to ignore consider_box_x, use xlims to find the horizontal placement of title
-        if not consider_box_x:
-            if pos == "left":
-                ha = "left"
-                x = self.xlims[0]
-            elif pos == "center":
-                ha = "center"
-                x = (self.xlims[1] + self.xlims[0]) / 2
-            elif pos == "right":
-                ha = "right"
-                x = self.xlims[1]
-            else:
-                raise ValueError("pos must be one of ['left', 'center', 'right']")
-
-        # if we are to consider_box_x
+        # validate pos once and dispatch through the module-level table rather
+        # than duplicated if/elif chains; pos doubles as the text alignment
+        x_from_extents = _TITLE_POS_X.get(pos)
+        if x_from_extents is None:
+            raise ValueError("pos must be one of ['left', 'center', 'right']")
+        ha = pos
+
+        # the horizontal extents come from the boxes placed so far if
+        # consider_box_x, otherwise from the axis limits
+        if consider_box_x:
+            x = x_from_extents(self._xFarLeft, self._xFarRight)
         else:
-            xFarLeft = float("inf")
-            xFarRight = float("-inf")
-            for box in self.boxes:
-                x_left = self.boxes[box].xLeft
-                x_right = self.boxes[box].xRight
-
-                if x_left is None or x_right is None:
-                    raise ValueError(
-                        f"LogicBox '{box}' layout not initialized: xLeft or xRight is None."
-                    )
-
-                if x_left < xFarLeft:
-                    xFarLeft = x_left
-                if x_right > xFarRight:
-                    xFarRight = x_right
-            if pos == "left":
-                ha = "left"
-                x = xFarLeft
-            elif pos == "right":
-                ha = "right"
-                x = xFarRight
-            elif pos == "center":
-                ha = "center"
-                x = (xFarRight + xFarLeft) / 2
-            else:
-                raise ValueError("pos must be one of ['left', 'center', 'right']")
+            x = x_from_extents(self.xlims[0], self.xlims[1])
 
         # finally make the title
         if self.title is None:
@@ -1548,10 +1941,11 @@ class LogicTree:
     def save_as_png(
         self,
         file_name: str,
-        dpi: int = 800,
+        dpi: int = 300,
         bbox_inches: Optional[Literal["tight"]] = "tight",
         content_padding: float = 0.0,
         aspect: Literal["auto", "equal"] = "equal",
+        compression: int = 1,
     ) -> None:
         """
         Export the LogicTree diagram as a high-resolution PNG image.
@@ -1564,18 +1958,97 @@ class LogicTree:
         file_name : str
             Full path and name of the output PNG file.
         dpi : int, optional
-            Resolution of the output image in dots per inch. Default is 800.
+            Resolution of the output image in dots per inch. Default is 300,
+            which keeps output sizes reasonable; raise it (e.g. 800) for
+            print-quality exports at the cost of a much larger raster.
         bbox_inches : {'tight'} or None, optional
             Whether to automatically crop whitespace around the figure. Default is "tight".
         content_padding : float, optional
             Padding (in inches) around the figure content. Helps avoid clipped labels or boxes.
         aspect : {'auto', 'equal'}, optional
             Axes aspect ratio mode. Default is 'equal'.
+        compression : int, optional
+            zlib compression level (0-9) for the PNG encoder. Default is 1;
+            at high dpi the default level 6 spends seconds shaving a few
+            percent off the file size, so fast compression is preferred.
         """
-        self.ax.set_aspect(aspect)
-        self.fig.savefig(
-            file_name, dpi=dpi, bbox_inches=bbox_inches, pad_inches=content_padding
-        )
+        self.render()
+        # matplotlib's aspect setter invalidates transforms and forces a
+        # relayout, so skip it when the mode is already in effect — repeat
+        # saves (multi-format export, dpi sweeps) then pay it only once
+        # (get_aspect reports 'equal' as the numeric ratio 1.0)
+        if self.ax.get_aspect() != (1.0 if aspect == "equal" else "auto"):
+            self.ax.set_aspect(aspect)
+        pil_kwargs = {"compress_level": compression, "optimize": False}
+        if bbox_inches == "tight":
+            # passing bbox_inches='tight' makes savefig do a full throwaway
+            # render just to measure the figure; measure once here with the
+            # layout-only draw and hand savefig the resulting Bbox instead
+            self.fig.draw_without_rendering()
+            tight_bbox = self.fig.get_tightbbox(
+                self.fig.canvas.get_renderer()  # type: ignore[attr-defined]
+            )
+            self.fig.savefig(
+                file_name,
+                dpi=dpi,
+                bbox_inches=tight_bbox.padded(content_padding),
+                pil_kwargs=pil_kwargs,
+            )
+        else:
+            self.fig.savefig(
+                file_name,
+                dpi=dpi,
+                bbox_inches=bbox_inches,
+                pad_inches=content_padding,
+                pil_kwargs=pil_kwargs,
+            )
+
+    def save_as_svg(
+        self,
+        file_name: str,
+        bbox_inches: Optional[Literal["tight"]] = "tight",
+        content_padding: float = 0.0,
+        aspect: Literal["auto", "equal"] = "equal",
+    ) -> None:
+        """
+        Export the LogicTree diagram as a scalable SVG image.
+
+        Vector output sidesteps Agg's per-pixel rasterization, which
+        dominates PNG export time at high dpi, and scales without loss for
+        publication figures. There is no dpi or compression to choose.
+
+        Parameters
+        ----------
+        file_name : str
+            Full path and name of the output SVG file.
+        bbox_inches : {'tight'} or None, optional
+            Whether to automatically crop whitespace around the figure. Default is "tight".
+        content_padding : float, optional
+            Padding (in inches) around the figure content. Helps avoid clipped labels or boxes.
+        aspect : {'auto', 'equal'}, optional
+            Axes aspect ratio mode. Default is 'equal'.
+        """
+        self.render()
+        if self.ax.get_aspect() != (1.0 if aspect == "equal" else "auto"):
+            self.ax.set_aspect(aspect)
+        if bbox_inches == "tight":
+            # measure once with the layout-only draw, as in save_as_png
+            self.fig.draw_without_rendering()
+            tight_bbox = self.fig.get_tightbbox(
+                self.fig.canvas.get_renderer()  # type: ignore[attr-defined]
+            )
+            self.fig.savefig(
+                file_name,
+                format="svg",
+                bbox_inches=tight_bbox.padded(content_padding),
+            )
+        else:
+            self.fig.savefig(
+                file_name,
+                format="svg",
+                bbox_inches=bbox_inches,
+                pad_inches=content_padding,
+            )
 
 
 __all__ = ["LogicTree"]
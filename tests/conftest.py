@@ -0,0 +1,17 @@
+"""Shared pytest configuration: backend selection and figure cleanup."""
+
+import matplotlib
+
+# select the backend once, before any test module imports pyplot
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _close_figures():
+    """Close all figures after each test so Agg canvases don't accumulate."""
+    yield
+    plt.close("all")
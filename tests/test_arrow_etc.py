@@ -130,6 +130,27 @@ def test_save_arrow_creates_image(tmp_path):
     close()
 
 
+def test_geometry_cache_bypassed_on_log_axes():
+    """Translated arrows on log axes must not share cached geometry."""
+    _, ax = subplots()
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.set_xlim(1, 1000)
+    ax.set_ylim(1, 1000)
+
+    # same data-space deltas, so an affine-only cache key would collide,
+    # but on log axes the display-space shapes (and thus the data-space
+    # vertex offsets) differ between the two positions
+    arrow_a = ArrowETC(ax=ax, path=[(1, 1), (2, 2)], shaft_width=20)
+    arrow_b = ArrowETC(ax=ax, path=[(101, 101), (102, 102)], shaft_width=20)
+
+    offsets_a = arrow_a.vertices - np.array([1.0, 1.0])
+    offsets_b = arrow_b.vertices - np.array([101.0, 101.0])
+    assert not np.allclose(offsets_a, offsets_b)
+
+    close()
+
+
 def test_get_segment_length_calculates_distances():
     """_get_segment_length should compute expected segment lengths."""
     _, ax = subplots()
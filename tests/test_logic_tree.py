@@ -1,10 +1,50 @@
-from numpy import allclose, array
-import matplotlib
+from math import isclose
+
+import numpy as np
+from numpy.testing import assert_allclose
 import pytest
 
-from logictree.logictree import ArrowETC, LogicBox, LogicTree
+from logictree.logictree import (
+    ArrowETC,
+    LogicBox,
+    LogicTree,
+    _mathtext_compatible,
+)
+
+# expected biSplit branch paths for the layout in
+# test_get_pathsForBi_left_then_right; built once at import
+EXPECTED_BI_LEFT = np.array(
+    [
+        (5, 10),
+        (-16.057347670250895, 10),
+        (-16.057347670250895, -14.054834054834053),
+    ]
+)
+EXPECTED_BI_RIGHT = EXPECTED_BI_LEFT
+
+
+@pytest.fixture(scope="module")
+def connection_tree():
+    """A tree with three laid-out boxes for the uninitialized-box tests.
+
+    Validation rejects the broken box before any connection state is
+    touched, so the parametrized negative tests can share one tree.
+    """
+    tree = LogicTree()
+    tree.add_box(5, 5, "boxAText", "boxA", "black", "white")
+    tree.add_box(0, 0, "boxBText", "boxB", "black", "white")
+    tree.add_box(10, 0, "boxCText", "boxC", "black", "white")
+    return tree
 
-matplotlib.use("Agg")
+
+@pytest.fixture(scope="module")
+def broken_box():
+    """A LogicBox that never went through add_box, so its layout is unset.
+
+    The negative-path tests only need validation to reject it; nothing
+    mutates it, so one instance serves the whole module.
+    """
+    return LogicBox(0, 10, "fail", "fail", "white", "black", {})
 
 
 def create_logic_box(tree, name, x, y, **kwargs):
@@ -52,7 +92,7 @@ def test_logic_tree_init():
     assert tree.font_dict["color"] == "green"
 
 
-def test_get_pathsForBi_left_then_right():
+def test_get_pathsForBi_left_then_right(broken_box):
     tree = LogicTree()
     tree.add_box(0, 0, "", "boxA", "black", "white")
     tree.add_box(0, 10, "", "boxB", "black", "white")
@@ -62,35 +102,23 @@ def test_get_pathsForBi_left_then_right():
             5,
             10,
             tree.boxes["boxA"],
-            LogicBox(0, 10, "fail", "fail", "white", "black", {}),
+            broken_box,
             0,
         )
     with pytest.raises(ValueError):
         tree._get_pathsForBi_left_then_right(
             5,
             10,
-            LogicBox(0, 10, "fail", "fail", "white", "black", {}),
+            broken_box,
             tree.boxes["boxB"],
             0,
         )
 
-    expected = (
-        [
-            (5, 10),
-            (-16.057347670250895, 10),
-            (-16.057347670250895, -14.054834054834053),
-        ],
-        [
-            (5, 10),
-            (-16.057347670250895, 10),
-            (-16.057347670250895, -14.054834054834053),
-        ],
-    )
     actual = tree._get_pathsForBi_left_then_right(
         5, 10, tree.boxes["boxA"], tree.boxes["boxB"], 0
     )
-    assert all(allclose(a, b) for a, b in zip(actual[0], expected[0]))
-    assert all(allclose(a, b) for a, b in zip(actual[1], expected[1]))
+    assert_allclose(actual[0], EXPECTED_BI_LEFT, atol=1e-8)
+    assert_allclose(actual[1], EXPECTED_BI_RIGHT, atol=1e-8)
 
 
 def test_add_box():
@@ -98,7 +126,7 @@ def test_add_box():
 
     tree.add_box(0, 2, "boxAText", "boxA", "black", "white")
     boxA = tree.boxes["boxA"]
-    assert allclose([boxA.xRight], [1.8], 0.01)
+    assert isclose(boxA.xRight, 1.8, rel_tol=0.01)
     assert boxA.text == "boxAText"
     assert boxA.name == "boxA"
     assert boxA.face_color == "black"
@@ -125,7 +153,7 @@ def test_add_box():
         angle=10,
     )
     boxB = tree.boxes["boxB"]
-    assert allclose([boxB.xLeft], [-2.657], 0.01)
+    assert isclose(boxB.xLeft, -2.657, rel_tol=0.01)
     assert boxB.text == "boxBText"
     assert boxB.name == "boxB"
     assert boxB.face_color == "white"
@@ -151,6 +179,71 @@ def test_add_box():
         tree.add_box(10, 20, "boxDText", "boxC", "green", "cyan")
 
 
+def test_batch_rendering():
+    tree = LogicTree()
+    tree.add_box(0, 0, "A", "boxA", "black", "white")
+    tree.add_box(10, 10, "B", "boxB", "white", "black")
+
+    with pytest.raises(RuntimeError):
+        tree.finish_batch()
+
+    tree.begin_batch()
+    tree.add_connection(
+        tree.boxes["boxA"], tree.boxes["boxB"], fill_connection=True
+    )
+    pending = list(tree._pending_artists)
+    assert len(pending) == 2  # fill polygon + outline
+    assert all(artist.get_animated() for artist in pending)
+
+    tree.finish_batch()
+    assert len(tree.arrows) == 1
+    # artists must be handed back to the normal draw tree, or interactive
+    # repaints (resize, show) would skip them
+    assert all(not artist.get_animated() for artist in pending)
+    assert all(artist.axes is tree.ax for artist in pending)
+
+
+def test_mathtext_compatible():
+    # pure text-mode commands and pure inline math can be rewritten
+    assert _mathtext_compatible(r"\textbf{bold label}")
+    assert _mathtext_compatible(r"$x^2 + y^2$")
+    # text-mode commands mixed with inline math must go through usetex
+    assert not _mathtext_compatible(r"\textbf{MDL = $x$}")
+    assert not _mathtext_compatible(r"$a + \text{b}$")
+    # constructs mathtext cannot render at all
+    assert not _mathtext_compatible(r"\ul{underlined}")
+    # commands with no rewrite rule stay in text mode and need usetex
+    assert not _mathtext_compatible(r"\emph{note}")
+    assert not _mathtext_compatible(r"\textsc{x}")
+    assert not _mathtext_compatible(r"\sout{x}")
+    # nested braces defeat the rewrite patterns, so usetex again
+    assert not _mathtext_compatible(r"\textbf{a {b} c}")
+
+
+def test_extent_cache_distinguishes_fonts():
+    tree = LogicTree()
+    tree.add_box(
+        0,
+        0,
+        "same label",
+        "mono",
+        "black",
+        "white",
+        font_dict={"family": "monospace", "fontsize": 15, "color": "white"},
+    )
+    tree.add_box(
+        0,
+        10,
+        "same label",
+        "serif",
+        "black",
+        "white",
+        font_dict={"family": "serif", "fontsize": 15, "color": "white"},
+    )
+    # identical text in different families must not share cached extents
+    assert tree.boxes["mono"].width != tree.boxes["serif"].width
+
+
 def test_add_arrow():
     tree = LogicTree()
 
@@ -259,25 +352,20 @@ def test_add_connection_biSplit():
     assert tree.arrows[5].fc == "green"
     assert tree.arrows[5].ec == "white"
 
-    # raise errors for uninitialized boxes
-    with pytest.raises(ValueError):
-        tree.add_connection_biSplit(
-            LogicBox(0, 10, "fail", "fail", "white", "black", {}),
-            tree.boxes["boxB"],
-            tree.boxes["boxC"],
-        )
-    with pytest.raises(ValueError):
-        tree.add_connection_biSplit(
-            tree.boxes["boxA"],
-            LogicBox(0, 10, "fail", "fail", "white", "black", {}),
-            tree.boxes["boxC"],
-        )
+
+# raise errors for uninitialized boxes, whichever slot they appear in
+@pytest.mark.parametrize("bad_slot", [0, 1, 2])
+def test_add_connection_biSplit_uninitialized_box(
+    connection_tree, broken_box, bad_slot
+):
+    args = [
+        connection_tree.boxes["boxA"],
+        connection_tree.boxes["boxB"],
+        connection_tree.boxes["boxC"],
+    ]
+    args[bad_slot] = broken_box
     with pytest.raises(ValueError):
-        tree.add_connection_biSplit(
-            tree.boxes["boxA"],
-            tree.boxes["boxB"],
-            LogicBox(0, 10, "fail", "fail", "white", "black", {}),
-        )
+        connection_tree.add_connection_biSplit(*args)
 
 
 def test_add_connection():
@@ -379,13 +467,22 @@ def test_add_connection():
     assert len(tree.arrows) == 5
     assert len(arr.vertices) == 11
 
-    # Invalid LogicBox without initialized layout
-    bad_box = LogicBox(20, 40, "fail", "fail", "white", "black", {})
-    with pytest.raises(ValueError, match="boxA LogicBox layout is not initialized"):
-        tree.add_connection(bad_box, tree.boxes["boxB"])
 
-    with pytest.raises(ValueError, match="boxB LogicBox layout is not initialized"):
-        tree.add_connection(tree.boxes["boxA"], bad_box)
+def test_add_connection_invalid_side_tuple_endpoint(connection_tree):
+    # a coordinate endpoint must reject unknown sides the same way a
+    # LogicBox endpoint does, not fall into a KeyError on the offset table
+    with pytest.raises(ValueError, match="Invalid side"):
+        connection_tree.add_connection(
+            connection_tree.boxes["boxA"], (20, 20), sideB="sideways", tip_offset=1.0
+        )
+
+
+@pytest.mark.parametrize("bad_slot, match", [(0, "boxA"), (1, "boxB")])
+def test_add_connection_uninitialized_box(connection_tree, broken_box, bad_slot, match):
+    args = [connection_tree.boxes["boxA"], connection_tree.boxes["boxB"]]
+    args[bad_slot] = broken_box
+    with pytest.raises(ValueError, match=f"{match} LogicBox layout is not initialized"):
+        connection_tree.add_connection(*args)
 
 
 def test_add_bezier_connection():
@@ -495,19 +592,28 @@ def test_add_bezier_connection():
     assert len(tree.arrows) == 5
     assert len(arr.vertices) > 500  # bezier path
 
-    # Invalid box layout should raise ValueError
-    broken_box = LogicBox(0, 0, "fail", "fail", "white", "black", {})
-    with pytest.raises(ValueError, match="boxA LogicBox layout is not initialized"):
-        tree.add_bezier_connection(broken_box, tree.boxes["boxB"])
 
-    with pytest.raises(ValueError, match="boxB LogicBox layout is not initialized"):
-        tree.add_bezier_connection(tree.boxes["boxA"], broken_box)
+@pytest.mark.parametrize("bad_slot, match", [(0, "boxA"), (1, "boxB")])
+def test_add_bezier_connection_uninitialized_box(
+    connection_tree, broken_box, bad_slot, match
+):
+    args = [connection_tree.boxes["boxA"], connection_tree.boxes["boxB"]]
+    args[bad_slot] = broken_box
+    with pytest.raises(ValueError, match=f"{match} LogicBox layout is not initialized"):
+        connection_tree.add_bezier_connection(*args)
 
 
-# smoke test for match case blocks determining tip and butt offset
-@pytest.mark.parametrize(
-    "side",
-    [
+# smoke test for the side-anchor / offset-sign logic; one tree serves all
+# eight sides since each connection is independent of the previous ones
+def test_add_connection_sides_cover_all_sides():
+    tree = LogicTree()
+
+    # Add two dummy boxes
+    tree.add_box(0, 0, "A", "boxA", "black", "white")
+    tree.add_box(10, 10, "B", "boxB", "white", "black")
+    tree.add_box(-10, 10, "C", "boxC", "white", "black")
+
+    for side in (
         "left",
         "topLeft",
         "top",
@@ -516,37 +622,27 @@ def test_add_bezier_connection():
         "bottomRight",
         "bottom",
         "bottomLeft",
-    ],
-)
-def test_add_connection_sides_cover_match_cases(side):
-    tree = LogicTree()
-
-    # Add two dummy boxes
-    tree.add_box(0, 0, "A", "boxA", "black", "white")
-    tree.add_box(10, 10, "B", "boxB", "white", "black")
-    tree.add_box(-10, 10, "C", "boxC", "white", "black")
-
-    # This should run the match-case logic for both sideA and sideB
-    tree.add_connection(
-        tree.boxes["boxA"],
-        tree.boxes["boxB"],
-        sideA=side,
-        sideB=side,
-        tip_offset=0.1,
-        butt_offset=0.1,
-    )
-    tree.add_bezier_connection(
-        tree.boxes["boxB"],
-        tree.boxes["boxC"],
-        sideA=side,
-        sideB=side,
-        tip_offset=0.2,
-        butt_offset=0.1,
-    )
-
-    matplotlib.pyplot.close()
+    ):
+        # This should run the side-resolution logic for both sideA and sideB
+        tree.add_connection(
+            tree.boxes["boxA"],
+            tree.boxes["boxB"],
+            sideA=side,
+            sideB=side,
+            tip_offset=0.1,
+            butt_offset=0.1,
+        )
+        tree.add_bezier_connection(
+            tree.boxes["boxB"],
+            tree.boxes["boxC"],
+            sideA=side,
+            sideB=side,
+            tip_offset=0.2,
+            butt_offset=0.1,
+        )
 
 
+@pytest.mark.slow
 def test_save_as_png(tmp_path):
     tree = LogicTree(title="Arrow Test")
     a = create_logic_box(tree, "A", 10, 20)
@@ -558,6 +654,19 @@ def test_save_as_png(tmp_path):
     assert output.exists()
 
 
+@pytest.mark.slow
+def test_save_as_svg(tmp_path):
+    tree = LogicTree(title="Arrow Test")
+    a = create_logic_box(tree, "A", 10, 20)
+    b = create_logic_box(tree, "B", 10, 10)
+    tree.add_connection(a, b)
+    output = tmp_path / "out.svg"
+    tree.save_as_svg(str(output))
+
+    assert output.exists()
+
+
+@pytest.mark.slow
 def test_make_title(tmp_path):
     tree = LogicTree(title="BiSplit Test")
     a = create_logic_box(tree, "A", 20, 30)